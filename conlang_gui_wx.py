@@ -12,11 +12,12 @@ License: GPL v2
 import wx
 import wx.adv
 import wx.lib.newevent
+import functools
+import queue
 import threading
-import wave
 import struct
-import tempfile
 import os
+import sys
 import time
 
 # Import the synthesis modules
@@ -32,14 +33,101 @@ try:
 except ImportError:
     HAS_WINSOUND = False
 
+# For streaming playback (starts audio while synthesis is still running)
+try:
+    import sounddevice as sd
+    HAS_SOUNDDEVICE = True
+except ImportError:
+    HAS_SOUNDDEVICE = False
+
 # Custom event for thread-safe status updates
 StatusUpdateEvent, EVT_STATUS_UPDATE = wx.lib.newevent.NewEvent()
 SpeechDoneEvent, EVT_SPEECH_DONE = wx.lib.newevent.NewEvent()
 
+# Sample text shown in the input box on startup, with tone examples
+_SAMPLE_TEXT = """hɛˈloʊ wɜːld
+
+Example phonemes:
+Vowels: a e i o u ɑ ɔ ə ɛ ɪ ʊ ʌ æ
+Consonants: p t k b d g f v s z ʃ ʒ θ ð m n ŋ l ɹ j w h
+
+Tone examples (try these):
+High tone: má (ma + acute accent)
+Low tone: mà (ma + grave accent)
+Rising tone: mǎ (ma + caron)
+Falling tone: mâ (ma + circumflex)
+Tone letters: ma˥ ma˩ ma˥˩ (high, low, falling)
+
+Chinese-style tones: mā má mǎ mà"""
+
+# Voice preset choices, fixed for the lifetime of the app
+_PROFILE_NAMES = voice_profiles.get_profile_names()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_ipa(ipa_text):
+    """Parse IPA text, cached so re-speaking it with new settings skips parsing."""
+    return tuple(ipa.parsePhonemes(ipa_text))
+
+
+# Bare modifier presses never map to a shortcut or IPA symbol
+_MODIFIER_KEYS = ipa_keyboard.get_modifier_keys()
+
+# Alt+key code -> ipa_keyboard lookup key, built once at import
+_IPA_KEYCODES = {code: chr(code).lower() for code in range(ord('A'), ord('Z') + 1)}  # A-Z
+_IPA_KEYCODES.update({code: chr(code) for code in range(ord('0'), ord('9') + 1)})  # 0-9
+_IPA_KEYCODES.update({
+    ord("'"): "'", 222: "'",  # Apostrophe
+    ord(':'): ':', 186: ':',  # Colon/semicolon key
+    ord('?'): '?',            # Question mark
+    ord('!'): '!',            # Exclamation
+    ord('.'): '.', 190: '.',  # Period
+    ord('-'): '-', 189: '-',  # Minus
+    ord('['): '[', 219: '[',  # Left bracket
+    ord(']'): ']', 221: ']',  # Right bracket
+    ord('/'): '/', 191: '/',  # Slash/question mark key
+})
+
+# Alt+Shift+key overrides for keys whose shifted symbol has its own mapping
+# (US layout); other keys fall back to _IPA_KEYCODES
+_IPA_SHIFTED_KEYCODES = {
+    ord('/'): '?', 191: '?',  # Question mark (Shift+/)
+    ord('1'): '!',            # Exclamation (Shift+1)
+    ord('6'): '^',            # Caret (Shift+6)
+}
+
+_WAV_HEADER_SIZE = 44
+
+
+def _wav_header(num_samples, sample_rate):
+    """Build the RIFF/WAVE header for 16-bit mono PCM data."""
+    data_size = num_samples * 2
+    return (b'RIFF' + struct.pack('<I', 36 + data_size) + b'WAVEfmt '
+            + struct.pack('<IHHIIHH', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+            + b'data' + struct.pack('<I', data_size))
+
 
 class ConlangSynthesizerFrame(wx.Frame):
     """Main application frame for the IPA synthesizer GUI."""
 
+    # Shared fonts, created on first use (a wx.App must exist by then)
+    _ui_font = None
+    _mono_font = None
+
+    @classmethod
+    def _get_ui_font(cls):
+        """Readable font for the IPA text input."""
+        if cls._ui_font is None:
+            cls._ui_font = wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, faceName="Segoe UI")
+        return cls._ui_font
+
+    @classmethod
+    def _get_mono_font(cls):
+        """Monospace font for the help text."""
+        if cls._mono_font is None:
+            cls._mono_font = wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+        return cls._mono_font
+
     def __init__(self):
         super().__init__(
             parent=None,
@@ -50,13 +138,31 @@ class ConlangSynthesizerFrame(wx.Frame):
         # Synthesis parameters
         self.sample_rate = 96000
         self.is_speaking = False
-        self.speech_thread = None
+        self.buffer_underruns = 0
+
+        # Latest status posted from a worker thread, not yet shown
+        self._pending_status = None
+        self._status_lock = threading.Lock()
+
+        # One persistent speech thread, fed (kind, ...) tasks through a queue.
+        # Each task gets its own cancel event; _cancel is the latest one, so
+        # Stop only ever cancels the job it was pressed for.
+        self._speech_jobs = queue.Queue()
+        self._cancel = threading.Event()
+        self.speech_thread = threading.Thread(target=self._speech_worker, daemon=True)
+        self.speech_thread.start()
 
         # IPA keyboard state for cycling
         self._last_ipa_key = None
         self._last_ipa_time = 0
         self._ipa_press_count = 0
         self._cycle_timeout = 0.5  # 500ms window for cycling
+        self._last_ipa_range = None  # (start, end) of the last inserted symbol
+        self._ipa_status_call = None  # Debounced "Inserted: ..." announcement
+
+        # Slider value labels, coalesced while a slider is being dragged
+        self._pending_labels = {}  # slider -> (value label, label text, help text)
+        self._label_call = None
 
         # Create UI
         self._create_menu_bar()
@@ -134,32 +240,17 @@ class ConlangSynthesizerFrame(wx.Frame):
 
         self.text_input = wx.TextCtrl(
             panel,
-            style=wx.TE_MULTILINE | wx.TE_RICH2 | wx.HSCROLL,
+            style=wx.TE_MULTILINE | wx.HSCROLL,
             size=(-1, 200)
         )
         self.text_input.SetName("IPA Text Input")
         self.text_input.SetHelpText("Enter IPA phonetic text here. Use Alt+letter for IPA symbols.")
 
         # Set a readable font
-        font = wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL, faceName="Segoe UI")
-        self.text_input.SetFont(font)
+        self.text_input.SetFont(self._get_ui_font())
 
         # Insert sample text with tone examples
-        sample_text = """hɛˈloʊ wɜːld
-
-Example phonemes:
-Vowels: a e i o u ɑ ɔ ə ɛ ɪ ʊ ʌ æ
-Consonants: p t k b d g f v s z ʃ ʒ θ ð m n ŋ l ɹ j w h
-
-Tone examples (try these):
-High tone: má (ma + acute accent)
-Low tone: mà (ma + grave accent)
-Rising tone: mǎ (ma + caron)
-Falling tone: mâ (ma + circumflex)
-Tone letters: ma˥ ma˩ ma˥˩ (high, low, falling)
-
-Chinese-style tones: mā má mǎ mà"""
-        self.text_input.SetValue(sample_text)
+        self.text_input.SetValue(_SAMPLE_TEXT)
 
         main_sizer.Add(self.text_input, 1, wx.ALL | wx.EXPAND, 5)
 
@@ -189,7 +280,8 @@ Chinese-style tones: mā má mǎ mà"""
         self.speed_slider.SetHelpText("Adjust speech speed from 0.5x to 2.0x. Current: 1.0x")
         grid_sizer.Add(self.speed_slider, 1, wx.EXPAND)
 
-        self.speed_value_label = wx.StaticText(panel, label="1.0x")
+        self.speed_value_label = wx.StaticText(panel, label="1.0x", style=wx.ST_NO_AUTORESIZE)
+        self._reserve_label_width(self.speed_value_label, "2.0x")
         self.speed_value_label.SetName("Speed value")
         grid_sizer.Add(self.speed_value_label, 0, wx.ALIGN_CENTER_VERTICAL)
 
@@ -209,7 +301,8 @@ Chinese-style tones: mā má mǎ mà"""
         self.pitch_slider.SetHelpText("Adjust base pitch from 60 to 300 Hz. Current: 120 Hz")
         grid_sizer.Add(self.pitch_slider, 1, wx.EXPAND)
 
-        self.pitch_value_label = wx.StaticText(panel, label="120 Hz")
+        self.pitch_value_label = wx.StaticText(panel, label="120 Hz", style=wx.ST_NO_AUTORESIZE)
+        self._reserve_label_width(self.pitch_value_label, "300 Hz")
         self.pitch_value_label.SetName("Pitch value")
         grid_sizer.Add(self.pitch_value_label, 0, wx.ALIGN_CENTER_VERTICAL)
 
@@ -229,7 +322,8 @@ Chinese-style tones: mā má mǎ mà"""
         self.inflection_slider.SetHelpText("Adjust pitch variation from 0.0 to 1.0. Current: 0.5")
         grid_sizer.Add(self.inflection_slider, 1, wx.EXPAND)
 
-        self.inflection_value_label = wx.StaticText(panel, label="0.5")
+        self.inflection_value_label = wx.StaticText(panel, label="0.5", style=wx.ST_NO_AUTORESIZE)
+        self._reserve_label_width(self.inflection_value_label, "1.0")
         self.inflection_value_label.SetName("Inflection value")
         grid_sizer.Add(self.inflection_value_label, 0, wx.ALIGN_CENTER_VERTICAL)
 
@@ -252,7 +346,7 @@ Chinese-style tones: mā má mǎ mà"""
         preset_label.SetName("Voice Preset label")
         voice_grid.Add(preset_label, 0, wx.ALIGN_CENTER_VERTICAL)
 
-        self.voice_preset_choice = wx.Choice(panel, choices=voice_profiles.get_profile_names())
+        self.voice_preset_choice = wx.Choice(panel, choices=_PROFILE_NAMES)
         self.voice_preset_choice.SetSelection(0)  # Default to Male
         self.voice_preset_choice.SetName("Voice Preset")
         self.voice_preset_choice.SetHelpText("Select a voice type preset: Male, Female, Child, or Custom")
@@ -277,7 +371,8 @@ Chinese-style tones: mā má mǎ mà"""
         self.formant_slider.SetHelpText("Scale formant frequencies. 1.0=male, 1.17=female, 1.35=child. Current: 1.00")
         voice_grid.Add(self.formant_slider, 1, wx.EXPAND)
 
-        self.formant_value_label = wx.StaticText(panel, label="1.00")
+        self.formant_value_label = wx.StaticText(panel, label="1.00", style=wx.ST_NO_AUTORESIZE)
+        self._reserve_label_width(self.formant_value_label, "1.50")
         self.formant_value_label.SetName("Formant Scale value")
         voice_grid.Add(self.formant_value_label, 0, wx.ALIGN_CENTER_VERTICAL)
 
@@ -297,7 +392,8 @@ Chinese-style tones: mā má mǎ mà"""
         self.breathiness_slider.SetHelpText("Spectral tilt in dB. Higher values = breathier voice. Current: 0 dB")
         voice_grid.Add(self.breathiness_slider, 1, wx.EXPAND)
 
-        self.breathiness_value_label = wx.StaticText(panel, label="0 dB")
+        self.breathiness_value_label = wx.StaticText(panel, label="0 dB", style=wx.ST_NO_AUTORESIZE)
+        self._reserve_label_width(self.breathiness_value_label, "24 dB")
         self.breathiness_value_label.SetName("Breathiness value")
         voice_grid.Add(self.breathiness_value_label, 0, wx.ALIGN_CENTER_VERTICAL)
 
@@ -394,6 +490,9 @@ Chinese-style tones: mā má mǎ mà"""
     def on_key_down(self, event):
         """Handle key events for IPA shortcuts."""
         key_code = event.GetKeyCode()
+        if key_code in _MODIFIER_KEYS:
+            event.Skip()
+            return
         modifiers = event.GetModifiers()
 
         # Check for Ctrl+Enter (speak)
@@ -406,35 +505,15 @@ Chinese-style tones: mā má mǎ mà"""
             self.on_stop(None)
             return
 
-        # Check for Alt+key (IPA shortcuts)
+        # Check for Alt+key and Alt+Shift+key (IPA shortcuts)
         if modifiers == wx.MOD_ALT:
-            # Convert key code to character
-            if 65 <= key_code <= 90:  # A-Z
-                lookup_key = chr(key_code).lower()
-            elif 48 <= key_code <= 57:  # 0-9
-                lookup_key = chr(key_code)
-            elif key_code == ord("'") or key_code == 222:  # Apostrophe
-                lookup_key = "'"
-            elif key_code == ord(':') or key_code == 186:  # Colon/semicolon key
-                lookup_key = ':'
-            elif key_code == ord('?') or key_code == 191:  # Question mark/slash key
-                lookup_key = '?'
-            elif key_code == ord('!') or key_code == 49:  # Exclamation (Shift+1)
-                lookup_key = '!'
-            elif key_code == ord('.') or key_code == 190:  # Period
-                lookup_key = '.'
-            elif key_code == ord('-') or key_code == 189:  # Minus
-                lookup_key = '-'
-            elif key_code == ord('[') or key_code == 219:  # Left bracket
-                lookup_key = '['
-            elif key_code == ord(']') or key_code == 221:  # Right bracket
-                lookup_key = ']'
-            elif key_code == ord('/') or key_code == 191:  # Slash
-                lookup_key = '/'
-            else:
-                event.Skip()
-                return
+            lookup_key = _IPA_KEYCODES.get(key_code)
+        elif modifiers == wx.MOD_ALT | wx.MOD_SHIFT:
+            lookup_key = _IPA_SHIFTED_KEYCODES.get(key_code, _IPA_KEYCODES.get(key_code))
+        else:
+            lookup_key = None
 
+        if lookup_key is not None:
             self._handle_ipa_key(lookup_key)
             return
 
@@ -448,10 +527,6 @@ Chinese-style tones: mā má mǎ mà"""
         if lookup_key == self._last_ipa_key and (current_time - self._last_ipa_time) < self._cycle_timeout:
             # Same key, increment press count
             self._ipa_press_count += 1
-            # Delete the previously inserted character
-            pos = self.text_input.GetInsertionPoint()
-            if pos > 0:
-                self.text_input.Remove(pos - 1, pos)
         else:
             # Different key or timeout expired, reset count
             self._ipa_press_count = 1
@@ -463,28 +538,72 @@ Chinese-style tones: mā má mǎ mà"""
         result = ipa_keyboard.get_symbol_for_key(lookup_key, self._ipa_press_count)
         if result:
             symbol, description = result
-            # Insert the symbol at cursor position
-            self.text_input.WriteText(symbol)
-            # Update status bar with symbol info (screen reader will announce)
-            self.set_status(f"Inserted: {symbol} ({description})")
+            pos = self.text_input.GetInsertionPoint()
+            last_range = self._last_ipa_range
+            if self._ipa_press_count > 1 and last_range is not None and last_range[1] == pos:
+                # Swap the previously inserted symbol (which may be several
+                # characters, e.g. a tie-bar affricate) for the next one in one edit
+                start = last_range[0]
+                self.text_input.Freeze()
+                try:
+                    self.text_input.Replace(start, pos, symbol)
+                finally:
+                    self.text_input.Thaw()
+            else:
+                # Insert the symbol at cursor position
+                start = pos
+                self.text_input.WriteText(symbol)
+            self._last_ipa_range = (start, start + len(symbol))
+
+            # Update status bar with symbol info (screen reader will announce).
+            # Debounced so rapid cycling only announces the symbol that sticks.
+            message = f"Inserted: {symbol} ({description})"
+            if self._ipa_status_call is not None and self._ipa_status_call.IsRunning():
+                self._ipa_status_call.Restart(100, message)
+            else:
+                self._ipa_status_call = wx.CallLater(100, self.set_status, message)
+
+    def _reserve_label_width(self, label, widest_text):
+        """Size a value label for its widest text so updates never relayout the panel."""
+        width, _ = label.GetTextExtent(widest_text)
+        label.SetMinSize((width, -1))
+
+    def _queue_slider_label(self, slider, value_label, label, help_text):
+        """Schedule a slider's value label and help text update.
+
+        Dragging a slider fires many events; only the last value in a 30ms
+        burst is written to the native controls.
+        """
+        self._pending_labels[slider] = (value_label, label, help_text)
+        if self._label_call is not None and self._label_call.IsRunning():
+            self._label_call.Restart(30)
+        else:
+            self._label_call = wx.CallLater(30, self._flush_slider_labels)
+
+    def _flush_slider_labels(self):
+        """Apply all pending slider label updates."""
+        pending, self._pending_labels = self._pending_labels, {}
+        for slider, (value_label, label, help_text) in pending.items():
+            value_label.SetLabelText(label)
+            slider.SetHelpText(help_text)
 
     def on_speed_change(self, event):
         """Update speed value label."""
-        value = self.speed_slider.GetValue() / 100.0
-        self.speed_value_label.SetLabel(f"{value:.1f}x")
-        self.speed_slider.SetHelpText(f"Adjust speech speed from 0.5x to 2.0x. Current: {value:.1f}x")
+        value = event.GetInt() / 100.0
+        self._queue_slider_label(self.speed_slider, self.speed_value_label, f"{value:.1f}x",
+                                 f"Adjust speech speed from 0.5x to 2.0x. Current: {value:.1f}x")
 
     def on_pitch_change(self, event):
         """Update pitch value label."""
-        value = self.pitch_slider.GetValue()
-        self.pitch_value_label.SetLabel(f"{value} Hz")
-        self.pitch_slider.SetHelpText(f"Adjust base pitch from 60 to 300 Hz. Current: {value} Hz")
+        value = event.GetInt() if event else self.pitch_slider.GetValue()
+        self._queue_slider_label(self.pitch_slider, self.pitch_value_label, f"{value} Hz",
+                                 f"Adjust base pitch from 60 to 300 Hz. Current: {value} Hz")
 
     def on_inflection_change(self, event):
         """Update inflection value label."""
-        value = self.inflection_slider.GetValue() / 100.0
-        self.inflection_value_label.SetLabel(f"{value:.1f}")
-        self.inflection_slider.SetHelpText(f"Adjust pitch variation from 0.0 to 1.0. Current: {value:.1f}")
+        value = event.GetInt() / 100.0
+        self._queue_slider_label(self.inflection_slider, self.inflection_value_label, f"{value:.1f}",
+                                 f"Adjust pitch variation from 0.0 to 1.0. Current: {value:.1f}")
 
     def on_voice_preset_change(self, event):
         """Apply voice preset settings when selection changes."""
@@ -512,9 +631,9 @@ Chinese-style tones: mā má mǎ mà"""
 
     def on_formant_change(self, event, from_preset=False):
         """Update formant scale value and switch to Custom if manual change."""
-        value = self.formant_slider.GetValue() / 100.0
-        self.formant_value_label.SetLabel(f"{value:.2f}")
-        self.formant_slider.SetHelpText(f"Scale formant frequencies. 1.0=male, 1.17=female, 1.35=child. Current: {value:.2f}")
+        value = (event.GetInt() if event else self.formant_slider.GetValue()) / 100.0
+        self._queue_slider_label(self.formant_slider, self.formant_value_label, f"{value:.2f}",
+                                 f"Scale formant frequencies. 1.0=male, 1.17=female, 1.35=child. Current: {value:.2f}")
 
         # Switch to Custom if user manually changed (not from preset)
         if event and not from_preset:
@@ -522,9 +641,9 @@ Chinese-style tones: mā má mǎ mà"""
 
     def on_breathiness_change(self, event, from_preset=False):
         """Update breathiness value and switch to Custom if manual change."""
-        value = self.breathiness_slider.GetValue()
-        self.breathiness_value_label.SetLabel(f"{value} dB")
-        self.breathiness_slider.SetHelpText(f"Spectral tilt in dB. Higher values = breathier voice. Current: {value} dB")
+        value = event.GetInt() if event else self.breathiness_slider.GetValue()
+        self._queue_slider_label(self.breathiness_slider, self.breathiness_value_label, f"{value} dB",
+                                 f"Spectral tilt in dB. Higher values = breathier voice. Current: {value} dB")
 
         # Switch to Custom if user manually changed (not from preset)
         if event and not from_preset:
@@ -537,118 +656,334 @@ Chinese-style tones: mā má mǎ mà"""
             self.voice_preset_choice.SetSelection(custom_index)
 
     def set_status(self, message):
-        """Update status bar (thread-safe)."""
+        """Update status bar (thread-safe).
+
+        Updates from worker threads are coalesced: only the latest message is
+        kept and at most one update event is pending at a time.
+        """
         if wx.IsMainThread():
             self.status_bar.SetStatusText(message)
-        else:
-            evt = StatusUpdateEvent(message=message)
-            wx.PostEvent(self, evt)
+            return
+
+        with self._status_lock:
+            needs_event = self._pending_status is None
+            self._pending_status = message
+        if needs_event:
+            wx.PostEvent(self, StatusUpdateEvent())
 
     def on_status_update(self, event):
-        """Handle status update event from thread."""
-        self.status_bar.SetStatusText(event.message)
+        """Show the latest status posted from a worker thread."""
+        with self._status_lock:
+            message = self._pending_status
+            self._pending_status = None
+        if message is not None:
+            self.status_bar.SetStatusText(message)
 
     def get_ipa_text(self):
         """Get the IPA text from the input area."""
         return self.text_input.GetValue().strip()
 
-    def synthesize_to_samples(self, ipa_text):
-        """Synthesize IPA text to audio samples.
-
-        Uses batched synthesis pattern like NVDA addon:
-        1. Queue ALL frames first (enables proper inter-frame interpolation)
-        2. Synthesize in batches of 8192 samples until done
+    def _get_synth_settings(self):
+        """Read the synthesis settings from the sliders (UI thread only)."""
+        return {
+            'speed': self.speed_slider.GetValue() / 100.0,
+            'basePitch': self.pitch_slider.GetValue(),
+            'inflection': self.inflection_slider.GetValue() / 100.0,
+            'formantScale': self.formant_slider.GetValue() / 100.0,
+            'spectralTilt': self.breathiness_slider.GetValue(),
+        }
+
+    def iter_sample_chunks(self, ipa_text, settings, cancel):
+        """Synthesize IPA text, yielding audio one batch at a time.
+
+        Uses batched synthesis pattern like NVDA addon, synthesizing in
+        batches of 8192 samples until done. Frames are generated lazily and
+        queued only LOOKAHEAD_MS ahead of synthesis, so audio starts before
+        a long text has been fully converted to frames. The engine always has
+        more than a batch of frames queued, so inter-frame interpolation is
+        the same as queueing every frame up front.
+
+        Args:
+            ipa_text: IPA string to synthesize
+            settings: keyword arguments for ipa.generateSubFramesAndTiming
+            cancel: threading.Event that stops synthesis when set
+
+        Yields:
+            memoryviews of 16-bit samples, one per batch; stops early if cancelled
         """
         sp = speechPlayer.SpeechPlayer(self.sample_rate)
-        all_samples = []
-
-        speed = self.speed_slider.GetValue() / 100.0
-        pitch = self.pitch_slider.GetValue()
-        inflection = self.inflection_slider.GetValue() / 100.0
-        formant_scale = self.formant_slider.GetValue() / 100.0
-        spectral_tilt = self.breathiness_slider.GetValue()
-
-        # Step 1: Queue ALL frames first
-        generator = ipa.generateSubFramesAndTiming
-
-        frame_count = 0
-        for frame, duration, fade in generator(
-            ipa_text,
-            speed=speed,
-            basePitch=pitch,
-            inflection=inflection,
-            formantScale=formant_scale,
-            spectralTilt=spectral_tilt
-        ):
-            if not self.is_speaking:
-                break
-
-            if frame:
-                sp.queueFrame(frame, duration, fade)
-            else:
-                sp.queueFrame(None, duration, fade)
-            frame_count += 1
-
-        if not self.is_speaking or frame_count == 0:
-            return []
+        frames = ipa.generateSubFramesAndTiming(ipa_text, parsedPhonemes=_parse_ipa(ipa_text), **settings)
 
-        # Step 2: Synthesize in batches (like NVDA does)
         BATCH_SIZE = 8192
-        while self.is_speaking:
+        samples_per_ms = self.sample_rate / 1000.0
+        LOOKAHEAD_MS = 2 * BATCH_SIZE / samples_per_ms
+        queued_ms = 0.0
+        synthesized_ms = 0.0
+
+        def frames_until(limit_ms):
+            # Pull frames off the generator until limit_ms of audio is queued
+            nonlocal queued_ms
+            for frame in frames:
+                queued_ms += frame[1]
+                yield frame
+                if queued_ms >= limit_ms:
+                    return
+
+        frames_left = sp.queueFrames(frames_until(LOOKAHEAD_MS)) > 0
+        if not frames_left:
+            return
+
+        while not cancel.is_set():
+            if frames_left and queued_ms < synthesized_ms + LOOKAHEAD_MS:
+                frames_left = sp.queueFrames(frames_until(synthesized_ms + LOOKAHEAD_MS)) > 0
             samples = sp.synthesize(BATCH_SIZE)
-            if samples and hasattr(samples, 'length') and samples.length > 0:
-                all_samples.extend(samples[:samples.length])
-            elif samples:
-                # Fallback if length attribute not set
-                all_samples.extend(samples[:])
-                if len(samples) < BATCH_SIZE:
-                    break
-            else:
+            if not samples:
                 break  # No more samples
+            synthesized_ms += samples.length / samples_per_ms
+            # Each call returns a fresh buffer, so hand out a view of it
+            # rather than copying the samples
+            yield memoryview(samples)[:samples.length]
+
+    def _build_wav(self, chunks):
+        """Assemble sample chunks into a complete 16-bit mono WAV image in memory.
 
-        return all_samples
+        Used for SND_MEMORY playback, which needs the whole image at once.
+        Space for the header is reserved at the front of the buffer and
+        filled in once the sample count is known.
 
-    def _speak_thread(self, ipa_text):
-        """Thread function for speaking."""
+        Returns:
+            (WAV bytearray, number of samples); the bytearray is None if
+            no samples were produced
+        """
+        wav = bytearray(_WAV_HEADER_SIZE)
+        for chunk in chunks:
+            wav += chunk
+        num_samples = (len(wav) - _WAV_HEADER_SIZE) // 2
+        if not num_samples:
+            return None, 0
+
+        wav[:_WAV_HEADER_SIZE] = _wav_header(num_samples, self.sample_rate)
+        return wav, num_samples
+
+    def _write_wav(self, file_path, chunks, cancel):
+        """Stream sample chunks into a 16-bit mono WAV file.
+
+        Chunks are written as they are synthesized to a temporary file next
+        to file_path, behind a placeholder header that is rewritten once the
+        sample count is known. The temporary file only replaces file_path if
+        synthesis produced samples and was not cancelled, so an empty or
+        cancelled synthesis leaves any existing file untouched.
+
+        Returns:
+            Number of samples written
+        """
+        tmp_path = f'{file_path}.{os.getpid()}.tmp'
+        num_samples = 0
         try:
-            self.set_status(f"Synthesizing: {len(ipa_text)} characters...")
-            samples = self.synthesize_to_samples(ipa_text)
+            with open(tmp_path, 'wb') as f:
+                f.write(_wav_header(0, self.sample_rate))
+                for chunk in chunks:
+                    f.write(chunk)
+                    num_samples += len(chunk)
+                if not num_samples or cancel.is_set():
+                    return 0
+                f.seek(0)
+                f.write(_wav_header(num_samples, self.sample_rate))
+            os.replace(tmp_path, file_path)
+            return num_samples
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
-            if not self.is_speaking or not samples:
-                return
+    def _play_streaming(self, chunks, cancel):
+        """Play sample chunks through sounddevice while synthesis continues.
 
-            self.set_status(f"Playing {len(samples)} samples...")
+        Chunks are fed into a bounded queue that the stream callback drains,
+        so audio starts with the first batch instead of after the whole
+        utterance, and synthesis only runs AUDIO_QUEUE_SIZE batches ahead of
+        playback. Gaps are filled with silence and counted in buffer_underruns.
 
-            # Save to temp file and play
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                tmp_path = tmp.name
+        Returns:
+            Number of samples played
+        """
+        AUDIO_QUEUE_SIZE = 8  # ~0.7 s of 8192-sample batches at 96 kHz
+        audio_queue = queue.Queue(maxsize=AUDIO_QUEUE_SIZE)
+        finished = threading.Event()
+        pending = bytearray()
+        end_of_audio = False
+        self.buffer_underruns = 0
+
+        def audio_callback(outdata, frames, time_info, status):
+            nonlocal end_of_audio
+            if cancel.is_set():
+                raise sd.CallbackAbort
+
+            needed = len(outdata)
+            while len(pending) < needed and not end_of_audio:
+                try:
+                    chunk = audio_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if chunk is None:
+                    end_of_audio = True
+                else:
+                    pending += chunk
+
+            count = min(needed, len(pending))
+            outdata[:count] = pending[:count]
+            del pending[:count]
+            if count < needed:
+                outdata[count:] = bytes(needed - count)
+                if end_of_audio:
+                    raise sd.CallbackStop
+                self.buffer_underruns += 1
+
+        def put(item):
+            # Wait for room in the queue, giving up if playback was stopped
+            # (the callback has aborted and will never drain it)
+            while True:
+                try:
+                    audio_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    if cancel.is_set():
+                        return False
+
+        stream = None
+        num_samples = 0
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    break
+                num_samples += len(chunk)
+                if stream is None:
+                    # Start once the first batch is ready to avoid an initial underrun
+                    stream = sd.RawOutputStream(
+                        samplerate=self.sample_rate,
+                        channels=1,
+                        dtype='int16',
+                        blocksize=1024,
+                        callback=audio_callback,
+                        finished_callback=finished.set,
+                    )
+                    stream.start()
+                    self.set_status("Playing...")
+            put(None)
+
+            if stream is not None:
+                finished.wait()
+        finally:
+            if stream is not None:
+                stream.close()
 
-            with wave.open(tmp_path, 'wb') as wav:
-                wav.setnchannels(1)
-                wav.setsampwidth(2)
-                wav.setframerate(self.sample_rate)
-                wav.writeframes(struct.pack('<%dh' % len(samples), *samples))
+        return num_samples
 
-            if self.is_speaking and HAS_WINSOUND:
-                winsound.PlaySound(tmp_path, winsound.SND_FILENAME)
+    def _play_via_wav(self, chunks, cancel):
+        """Build a WAV image in memory from sample chunks and play it with winsound.
 
-            # Cleanup
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
+        Returns:
+            Number of samples played
+        """
+        wav, num_samples = self._build_wav(chunks)
 
-            self.set_status("Done.")
+        if not cancel.is_set() and num_samples:
+            self.set_status(f"Playing {num_samples} samples...")
+
+            if HAS_WINSOUND:
+                # SND_MEMORY can't be combined with SND_ASYNC, so this blocks
+                # the speech thread until playback ends or on_stop purges it
+                winsound.PlaySound(wav, winsound.SND_MEMORY)
+
+        return num_samples
+
+    def _warm_up(self):
+        """Load the synth DLL and run a short utterance through the pipeline.
+
+        Runs on the speech thread before it takes its first job, so the
+        first Speak doesn't pay the cold-start cost (a Speak pressed sooner
+        simply waits in the job queue).
+        """
+        try:
+            sp = speechPlayer.SpeechPlayer(self.sample_rate)
+            sp.queueFrames(ipa.generateSubFramesAndTiming("a"))
+            sp.synthesize(1024)
+        except Exception:
+            pass  # A real problem will be reported by the first Speak
+
+    def _speech_worker(self):
+        """Run queued speak/save tasks one at a time until a None task arrives."""
+        self._warm_up()
+        while True:
+            task = self._speech_jobs.get()
+            if task is None:
+                break
+            kind, args = task[0], task[1:]
+            if kind == 'speak':
+                self._speak_thread(*args)
+            elif kind == 'save':
+                self._save_thread(*args)
+
+    def _start_task(self, kind, *args):
+        """Queue a speak/save task for the speech thread with a fresh cancel event."""
+        self._cancel = threading.Event()
+        self.is_speaking = True
+        self._update_buttons()
+        self._speech_jobs.put((kind,) + args + (self._cancel,))
+
+    def _speak_thread(self, ipa_text, settings, cancel):
+        """Speak one utterance on the speech thread."""
+        try:
+            self.set_status(f"Synthesizing: {len(ipa_text)} characters...")
+            chunks = self.iter_sample_chunks(ipa_text, settings, cancel)
+
+            if HAS_SOUNDDEVICE:
+                num_samples = self._play_streaming(chunks, cancel)
+            else:
+                num_samples = self._play_via_wav(chunks, cancel)
+
+            if not cancel.is_set() and num_samples:
+                if self.buffer_underruns:
+                    self.set_status(f"Done ({self.buffer_underruns} buffer underruns).")
+                else:
+                    self.set_status("Done.")
 
         except Exception as e:
             self.set_status(f"Error: {e}")
         finally:
-            self.is_speaking = False
-            evt = SpeechDoneEvent()
-            wx.PostEvent(self, evt)
+            wx.PostEvent(self, SpeechDoneEvent(cancel=cancel))
+
+    def _save_thread(self, file_path, ipa_text, settings, cancel):
+        """Synthesize an utterance to a WAV file on the speech thread."""
+        try:
+            self.set_status("Synthesizing for save...")
+            num_samples = self._write_wav(
+                file_path, self.iter_sample_chunks(ipa_text, settings, cancel), cancel)
+
+            if cancel.is_set():
+                self.set_status("Save cancelled.")
+            elif not num_samples:
+                self.set_status("No audio generated.")
+            else:
+                self.set_status(f"Saved to {os.path.basename(file_path)}")
+
+        except Exception as e:
+            self.set_status(f"Save error: {e}")
+            wx.CallAfter(
+                wx.MessageBox,
+                f"Could not save file: {e}",
+                "Error",
+                wx.OK | wx.ICON_ERROR
+            )
+        finally:
+            wx.PostEvent(self, SpeechDoneEvent(cancel=cancel))
 
     def on_speech_done(self, event):
-        """Handle speech completion event."""
+        """Handle speech/save completion event."""
+        # Ignore a job that was stopped and has since been replaced
+        if event.cancel is self._cancel:
+            self.is_speaking = False
         self._update_buttons()
 
     def _update_buttons(self):
@@ -674,19 +1009,12 @@ Chinese-style tones: mā má mǎ mà"""
             self.set_status("No text to speak.")
             return
 
-        self.is_speaking = True
-        self._update_buttons()
-
-        self.speech_thread = threading.Thread(
-            target=self._speak_thread,
-            args=(ipa_text,),
-            daemon=True
-        )
-        self.speech_thread.start()
+        self._start_task('speak', ipa_text, self._get_synth_settings())
 
     def on_stop(self, event):
         """Stop speaking."""
         if self.is_speaking:
+            self._cancel.set()
             self.is_speaking = False
             if HAS_WINSOUND:
                 winsound.PlaySound(None, winsound.SND_PURGE)
@@ -695,6 +1023,9 @@ Chinese-style tones: mā má mǎ mà"""
 
     def on_save_wav(self, event):
         """Save the synthesized audio to a WAV file."""
+        if self.is_speaking:
+            return
+
         ipa_text = self.get_ipa_text()
         if not ipa_text:
             self.set_status("No text to save.")
@@ -711,31 +1042,7 @@ Chinese-style tones: mā má mǎ mà"""
 
             file_path = dlg.GetPath()
 
-        try:
-            self.set_status("Synthesizing for save...")
-            self.is_speaking = True  # Use this flag to allow synthesis
-            samples = self.synthesize_to_samples(ipa_text)
-            self.is_speaking = False
-
-            if not samples:
-                self.set_status("No audio generated.")
-                return
-
-            with wave.open(file_path, 'wb') as wav:
-                wav.setnchannels(1)
-                wav.setsampwidth(2)
-                wav.setframerate(self.sample_rate)
-                wav.writeframes(struct.pack('<%dh' % len(samples), *samples))
-
-            self.set_status(f"Saved to {os.path.basename(file_path)}")
-
-        except Exception as e:
-            self.set_status(f"Save error: {e}")
-            wx.MessageBox(
-                f"Could not save file: {e}",
-                "Error",
-                wx.OK | wx.ICON_ERROR
-            )
+        self._start_task('save', file_path, ipa_text, self._get_synth_settings())
 
     def on_clear(self, event):
         """Clear the text input."""
@@ -770,8 +1077,7 @@ Chinese-style tones: mā má mǎ mà"""
         help_ctrl.SetName("IPA Keyboard Help")
 
         # Use monospace font for better formatting
-        font = wx.Font(10, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        help_ctrl.SetFont(font)
+        help_ctrl.SetFont(self._get_mono_font())
 
         sizer.Add(help_ctrl, 1, wx.ALL | wx.EXPAND, 10)
 
@@ -809,9 +1115,15 @@ Chinese-style tones: mā má mǎ mà"""
     def on_close(self, event):
         """Handle window close."""
         if self.is_speaking:
+            self._cancel.set()
             self.is_speaking = False
             if HAS_WINSOUND:
                 winsound.PlaySound(None, winsound.SND_PURGE)
+        self._speech_jobs.put(None)
+        # Pending debounced updates must not fire against a destroyed frame
+        for call in (self._label_call, self._ipa_status_call):
+            if call is not None and call.IsRunning():
+                call.Stop()
         event.Skip()
 
 
@@ -820,11 +1132,13 @@ def main():
     app = wx.App()
 
     # Enable high DPI support on Windows
-    try:
-        import ctypes
-        ctypes.windll.shcore.SetProcessDpiAwareness(1)
-    except:
-        pass
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        except (OSError, AttributeError):
+            # shcore is missing before Windows 8.1
+            pass
 
     frame = ConlangSynthesizerFrame()
     frame.Show()
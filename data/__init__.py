@@ -3,7 +3,17 @@
 Phoneme data module for NV Speech Player.
 
 This module provides the phoneme database split into logical categories.
-Import `data` to get the complete merged dictionary.
+Import `data` to get the complete merged dictionary. The merged result is
+cached in `_prebuilt.marshal` next to this file and rebuilt whenever one of
+the category modules or `calculations.py` changes.
+
+The category modules below are the source the cache is built from, not
+the live data. When the cache is current they are not imported at all, and
+importing one directly (e.g. `data.vowels_front.VOWELS_FRONT`) gives dicts
+that are separate from the entries in `data` and lack the parameters added
+by `calculations.py` (deltaF1, ftzFreq2, ...). Use `data`,
+`PHONEME_CATEGORIES` or the package-level constants (`data.VOWELS_FRONT`)
+instead; those share their entries with `data`.
 
 Categories:
   - vowels_front
@@ -20,45 +30,108 @@ Categories:
   - special
 """
 
-# Import all category modules
-from .vowels_front import VOWELS_FRONT
-from .vowels_central import VOWELS_CENTRAL
-from .vowels_back import VOWELS_BACK
-from .vowels_rcolored import VOWELS_RCOLORED
-from .vowels_nasalized import VOWELS_NASALIZED
-from .diphthongs import DIPHTHONGS
-from .stops import STOPS
-from .fricatives import FRICATIVES
-from .affricates import AFFRICATES
-from .nasals import NASALS
-from .liquids_glides import LIQUIDS_GLIDES
-from .special import SPECIAL
-from .clicks import CLICKS
-
-# Merge all dictionaries into one
-data = {}
-data.update(VOWELS_FRONT)
-data.update(VOWELS_CENTRAL)
-data.update(VOWELS_BACK)
-data.update(VOWELS_RCOLORED)
-data.update(VOWELS_NASALIZED)
-data.update(DIPHTHONGS)
-data.update(STOPS)
-data.update(FRICATIVES)
-data.update(AFFRICATES)
-data.update(NASALS)
-data.update(LIQUIDS_GLIDES)
-data.update(SPECIAL)
-data.update(CLICKS)
-
-# Apply automatic parameter calculations for new synthesis features
-# This adds deltaF1, deltaB1, ftzFreq2, ftzBw2, sinusoidalVoicingAmplitude,
-# aspirationFilterFreq, aspirationFilterBw based on Klatt acoustic formulas
-from .calculations import update_all_phonemes
-update_all_phonemes(data)
+import os as _os
+import marshal as _marshal
+from importlib import import_module as _import_module
+from sys import intern as _intern
+
+_DIR = _os.path.dirname(__file__)
+
+# Merged, calculations-applied data written by the first import and
+# reused while none of the source modules below have changed. marshal
+# rather than pickle: it is built in, so loading costs no extra imports.
+_PREBUILT_PATH = _os.path.join(_DIR, '_prebuilt.marshal')
+_PREBUILT_VERSION = 1
+
+# (category name, module, dict name) in merge order
+_CATEGORY_SOURCES = [
+    ('Vowels - Front', 'vowels_front', 'VOWELS_FRONT'),
+    ('Vowels - Central', 'vowels_central', 'VOWELS_CENTRAL'),
+    ('Vowels - Back', 'vowels_back', 'VOWELS_BACK'),
+    ('Vowels - R-colored', 'vowels_rcolored', 'VOWELS_RCOLORED'),
+    ('Vowels - Nasalized', 'vowels_nasalized', 'VOWELS_NASALIZED'),
+    ('Diphthongs', 'diphthongs', 'DIPHTHONGS'),
+    ('Stops', 'stops', 'STOPS'),
+    ('Fricatives', 'fricatives', 'FRICATIVES'),
+    ('Affricates', 'affricates', 'AFFRICATES'),
+    ('Nasals', 'nasals', 'NASALS'),
+    ('Liquids & Glides', 'liquids_glides', 'LIQUIDS_GLIDES'),
+    ('Special', 'special', 'SPECIAL'),
+    ('Clicks', 'clicks', 'CLICKS'),
+]
+
+
+def _source_stamps():
+    """Return (module, mtime_ns, size) for every file the merged data depends on."""
+    stamps = []
+    for module_name in [m for _, m, _ in _CATEGORY_SOURCES] + ['_defaults', 'calculations', '__init__']:
+        st = _os.stat(_os.path.join(_DIR, module_name + '.py'))
+        stamps.append((module_name, st.st_mtime_ns, st.st_size))
+    return stamps
+
+
+def _build():
+    """Import the category modules, merge them and apply the calculations."""
+    sources = [
+        (category, getattr(_import_module('.' + module_name, __name__), dict_name))
+        for category, module_name, dict_name in _CATEGORY_SOURCES
+    ]
+    # One merge in source order; later categories still win on key clashes.
+    # Multi-character IPA keys are not interned by the compiler the way the
+    # parameter names are; interning them here also carries over through
+    # the marshal cache, which keeps the interned flag.
+    merged = {_intern(key): value for _, phonemes in sources for key, value in phonemes.items()}
+    category_keys = {category: [_intern(key) for key in phonemes] for category, phonemes in sources}
+
+    # Apply automatic parameter calculations for new synthesis features
+    # This adds deltaF1, deltaB1, ftzFreq2, ftzBw2, sinusoidalVoicingAmplitude,
+    # aspirationFilterFreq, aspirationFilterBw based on Klatt acoustic formulas
+    from .calculations import update_all_phonemes
+    update_all_phonemes(merged)
+    return merged, category_keys
+
+
+def _load():
+    """Return (data, category keys), from the prebuilt file when it is current."""
+    try:
+        stamps = _source_stamps()
+    except OSError:
+        stamps = None
+    if stamps is not None:
+        try:
+            # One read then loads(): marshal.load() on a file reads piecemeal
+            with open(_PREBUILT_PATH, 'rb') as f:
+                prebuilt = _marshal.loads(f.read())
+            if prebuilt['version'] == _PREBUILT_VERSION and prebuilt['sources'] == stamps:
+                return prebuilt['data'], prebuilt['categories']
+        except Exception:
+            # Missing, unreadable or written by an incompatible Python
+            pass
+
+    merged, category_keys = _build()
+    if stamps is not None:
+        tmp_path = '%s.%d.tmp' % (_PREBUILT_PATH, _os.getpid())
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_marshal.dumps({
+                    'version': _PREBUILT_VERSION,
+                    'sources': stamps,
+                    'data': merged,
+                    'categories': category_keys,
+                }))
+            _os.replace(tmp_path, _PREBUILT_PATH)
+        except (OSError, ValueError):
+            # Read-only install, or an entry marshal cannot store; just build again next time
+            try:
+                _os.remove(tmp_path)
+            except OSError:
+                pass
+    return merged, category_keys
+
+
+data, _category_keys = _load()
 
 # Optional JSON preset overlay (activated by env var)
-import os as _os
 if _os.environ.get('NVSPEECHPLAYER_USE_JSON_PRESETS', '').strip() == '1':
     _presets_dir = _os.path.join(_os.path.dirname(_os.path.dirname(__file__)), 'editor', 'presets')
     if _os.path.isdir(_presets_dir):
@@ -69,23 +142,6 @@ if _os.environ.get('NVSPEECHPLAYER_USE_JSON_PRESETS', '').strip() == '1':
             else:
                 data[_ipa] = _params
 
-# Category mappings for organized menu display
-PHONEME_CATEGORIES = {
-    'Vowels - Front': VOWELS_FRONT,
-    'Vowels - Central': VOWELS_CENTRAL,
-    'Vowels - Back': VOWELS_BACK,
-    'Vowels - R-colored': VOWELS_RCOLORED,
-    'Vowels - Nasalized': VOWELS_NASALIZED,
-    'Diphthongs': DIPHTHONGS,
-    'Stops': STOPS,
-    'Fricatives': FRICATIVES,
-    'Affricates': AFFRICATES,
-    'Nasals': NASALS,
-    'Liquids & Glides': LIQUIDS_GLIDES,
-    'Special': SPECIAL,
-    'Clicks': CLICKS,
-}
-
 # Ordered list for menu display
 CATEGORY_ORDER = [
     'Vowels - Front',
@@ -103,5 +159,36 @@ CATEGORY_ORDER = [
     'Clicks',
 ]
 
+# Category dict constant name -> PHONEME_CATEGORIES key
+_LAZY = {dict_name: category for category, _, dict_name in _CATEGORY_SOURCES}
+
+
+def _build_categories():
+    # Category dicts share their phoneme entries with `data`
+    return {
+        category: {key: data[key] for key in _category_keys[category]}
+        for category in CATEGORY_ORDER
+    }
+
+
+def __getattr__(name):
+    # PHONEME_CATEGORIES and the per-category constants (VOWELS_FRONT, ...)
+    # are only needed by the editor, so build them on first use instead of
+    # importing the category modules up front.
+    if name == 'PHONEME_CATEGORIES' or name in _LAZY:
+        categories = globals().get('PHONEME_CATEGORIES')
+        if categories is None:
+            categories = globals()['PHONEME_CATEGORIES'] = _build_categories()
+        if name == 'PHONEME_CATEGORIES':
+            return categories
+        value = globals()[name] = categories[_LAZY[name]]
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {'PHONEME_CATEGORIES'})
+
+
 # For backwards compatibility
 __all__ = ["data", "PHONEME_CATEGORIES", "CATEGORY_ORDER"]
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Shared parameter blocks for the phoneme data modules.
+
+Entries splice these in with ** and list only the values that differ.
+"""
+
+# Tracheal formants disabled (neutral poles/zeros)
+TRACHEAL_OFF = {
+	'ftpFreq1': 0,
+	'ftpBw1': 100,
+	'ftzFreq1': 0,
+	'ftzBw1': 100,
+	'ftpFreq2': 0,
+	'ftpBw2': 100,
+}
+
+# Nasal pole/zero pair parked, nasal coupling off (oral phonemes).
+# Split in two so entries can splice each part where it sits among the
+# cascade frequencies and bandwidths, keeping the usual key order.
+NASAL_OFF_CF = {
+	'cfNP': 200,
+	'cfN0': 250,
+}
+NASAL_OFF_CB = {
+	'cbNP': 100,
+	'cbN0': 100,
+	'caNP': 0,
+}
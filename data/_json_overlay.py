@@ -13,7 +13,23 @@ The NVDA addon never sets this env var, so it is unaffected.
 
 import os
 import json
-import glob
+import fnmatch
+import marshal
+
+# Optional faster JSON parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Parsed overlay kept in the presets directory and reused while no preset
+# file has been added, removed or modified
+_CACHE_NAME = '.overlay_cache.marshal'
+# Bump when the cached result's layout changes; edits to this module's
+# parsing are picked up through its own mtime/size in the signature
+_CACHE_VERSION = 1
 
 
 # Metadata keys in JSON that map to internal flags
@@ -33,13 +49,69 @@ def load_json_presets_overlay(presets_dir):
         Dict of {ipa_str: {param_key: value, ...}} with internal flags
         restored from JSON metadata fields.
     """
+    # One directory scan yields both the preset paths and the stat data
+    # for the cache signature (free on Windows, cached per entry elsewhere)
+    # The signature starts with this module's own stamp, so a change to the
+    # parsing or _FLAG_MAP invalidates the cache as well
+    paths = []
+    try:
+        st = os.stat(__file__)
+        signature = [('_json_overlay', _CACHE_VERSION, st.st_mtime_ns, st.st_size)]
+    except OSError:
+        signature = None
+    try:
+        with os.scandir(presets_dir) as it:
+            for entry in it:
+                # Same selection as glob('*.json'): no hidden files
+                if entry.name.startswith('.') or not fnmatch.fnmatch(entry.name, '*.json'):
+                    continue
+                paths.append(entry.path)
+                if signature is not None:
+                    try:
+                        st = entry.stat()
+                        signature.append((entry.name, st.st_mtime_ns, st.st_size))
+                    except OSError:
+                        signature = None
+    except OSError:
+        return {}
+
+    cache_path = os.path.join(presets_dir, _CACHE_NAME)
+    if signature is not None:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = marshal.loads(f.read())
+            if cached['signature'] == signature:
+                return cached['result']
+        except Exception:
+            pass
+
+    result = _parse_presets(paths)
+
+    if signature is not None:
+        tmp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(marshal.dumps({'signature': signature, 'result': result}))
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            # Read-only directory, or a preset value marshal cannot store
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    return result
+
+
+def _parse_presets(paths):
     result = {}
 
-    for filepath in glob.glob(os.path.join(presets_dir, '*.json')):
+    for filepath in paths:
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                preset = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(filepath, 'rb') as f:
+                preset = _json_loads(f.read())
+        except (ValueError, OSError):
+            # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
             continue
 
         ipa = preset.get('ipa')
@@ -13,6 +13,85 @@ New parameters calculated:
 """
 
 
+# The calculations on plain values. update_phoneme_with_new_params reads
+# each phoneme field once and calls these directly; the calc_* functions
+# below are the dict-based wrappers.
+
+# Pitch-synchronous F1 coupling per phoneme class (see _phonemeClass):
+# (fraction of F1 for deltaF1, cap in Hz, deltaB1 multiplier)
+_F1_COUPLING = (
+    (0.05, 20, 4),              # Nasals: stronger subglottal coupling, strongest bandwidth modulation
+    (0.02, 10, 3),              # Vowels: moderate coupling
+    (0.03, 12, 3.5),            # Liquids: similar to vowels
+    (0.01, float('inf'), 2),    # Stops (minimal during closure), fricatives/other: weaker effect
+)
+
+
+def _phonemeClass(isNasal, isVowel, isLiquid):
+    if isNasal:
+        return 0
+    if isVowel:
+        return 1
+    if isLiquid:
+        return 2
+    return 3
+
+
+def _deltaF1(cf1, phonemeClass):
+    coef, cap, _ = _F1_COUPLING[phonemeClass]
+    return min(cap, cf1 * coef)
+
+
+def _deltaB1(deltaF1, phonemeClass):
+    return min(400, deltaF1 * _F1_COUPLING[phonemeClass][2])
+
+
+def _ftzFreq2(ftpFreq2):
+    # Only active if second tracheal pole is active
+    if ftpFreq2 > 0:
+        # Zero slightly below pole frequency (Klatt 1990: ~1300-1400 Hz)
+        return max(0, ftpFreq2 - 150)
+    return 0
+
+
+def _ftzBw2(ftzFreq2):
+    if ftzFreq2 > 0:
+        return 150  # Klatt 1990: 125-180 Hz typical
+    return 200  # Default when disabled
+
+
+def _sinusoidalVoicing(isVoiced, isStop, frication):
+    if not isVoiced:
+        return 0.0
+
+    # Voiced fricatives: strong voicebar component
+    if frication > 0.5:
+        return 0.35  # Prominent voicebar for /v/, /z/, /ʒ/, etc.
+
+    # Voiced stops during closure: mild voicebar
+    if isStop:
+        return 0.25  # Voice bar visible in spectrogram
+
+    # Vowels, nasals, liquids: use complex LF glottal model instead
+    return 0.0
+
+
+def _aspirationFilterFreq(aspiration, isStop, isVoiced):
+    # Only high aspiration (/h/, breathy voice) gets mid-frequency emphasis
+    # at the glottal aspiration spectral peak. No or weak aspiration, and
+    # voiceless stops, use white noise (unfiltered). Most phonemes have no
+    # aspiration and fail the first comparison.
+    if aspiration > 0.3 and not (isStop and not isVoiced):
+        return 1500
+    return 0
+
+
+def _aspirationFilterBw(freq):
+    if freq > 0:
+        return 2000  # Broad filter for natural aspiration
+    return 2000  # Default bandwidth
+
+
 def calc_deltaF1(phoneme_data):
     """
     Calculate pitch-synchronous F1 frequency increase during glottal open phase.
@@ -26,23 +105,9 @@ def calc_deltaF1(phoneme_data):
     Returns:
         float: deltaF1 in Hz (0-100 range)
     """
-    cf1 = phoneme_data.get('cf1', 500)
-
-    if phoneme_data.get('_isNasal'):
-        # Nasals: stronger subglottal coupling (5% of F1, max 20 Hz)
-        return min(20, cf1 * 0.05)
-    elif phoneme_data.get('_isVowel'):
-        # Vowels: moderate coupling (2% of F1, max 10 Hz)
-        return min(10, cf1 * 0.02)
-    elif phoneme_data.get('_isLiquid'):
-        # Liquids: similar to vowels (3% of F1, max 12 Hz)
-        return min(12, cf1 * 0.03)
-    elif phoneme_data.get('_isStop'):
-        # Stops: minimal during closure (1% of F1)
-        return cf1 * 0.01
-    else:
-        # Fricatives/other: minimal (1% of F1)
-        return cf1 * 0.01
+    phonemeClass = _phonemeClass(phoneme_data.get('_isNasal'), phoneme_data.get('_isVowel'),
+                                 phoneme_data.get('_isLiquid'))
+    return _deltaF1(phoneme_data.get('cf1', 500), phonemeClass)
 
 
 def calc_deltaB1(phoneme_data, deltaF1):
@@ -59,18 +124,9 @@ def calc_deltaB1(phoneme_data, deltaF1):
     Returns:
         float: deltaB1 in Hz (0-400 range)
     """
-    if phoneme_data.get('_isNasal'):
-        # Nasals: strongest bandwidth modulation
-        return min(400, deltaF1 * 4)
-    elif phoneme_data.get('_isVowel'):
-        # Vowels: moderate bandwidth modulation
-        return min(400, deltaF1 * 3)
-    elif phoneme_data.get('_isLiquid'):
-        # Liquids: similar to vowels
-        return min(400, deltaF1 * 3.5)
-    else:
-        # Fricatives, stops, other: weaker effect
-        return min(400, deltaF1 * 2)
+    phonemeClass = _phonemeClass(phoneme_data.get('_isNasal'), phoneme_data.get('_isVowel'),
+                                 phoneme_data.get('_isLiquid'))
+    return _deltaB1(deltaF1, phonemeClass)
 
 
 def calc_ftzFreq2(phoneme_data):
@@ -86,16 +142,10 @@ def calc_ftzFreq2(phoneme_data):
     Returns:
         float: ftzFreq2 in Hz (0 = disabled)
     """
-    ftpFreq2 = phoneme_data.get('ftpFreq2', 0)
-
-    # Only active if second tracheal pole is active
-    if ftpFreq2 > 0:
-        # Zero slightly below pole frequency (Klatt 1990: ~1300-1400 Hz)
-        return max(0, ftpFreq2 - 150)
-    return 0
+    return _ftzFreq2(phoneme_data.get('ftpFreq2', 0))
 
 
-def calc_ftzBw2(phoneme_data):
+def calc_ftzBw2(phoneme_data, ftzFreq2=None):
     """
     Calculate second tracheal zero bandwidth.
 
@@ -103,14 +153,14 @@ def calc_ftzBw2(phoneme_data):
 
     Args:
         phoneme_data: Dictionary with phoneme parameters
+        ftzFreq2: Previously calculated ftzFreq2 value (calculated if None)
 
     Returns:
         float: ftzBw2 in Hz
     """
-    ftzFreq2 = calc_ftzFreq2(phoneme_data)
-    if ftzFreq2 > 0:
-        return 150  # Klatt 1990: 125-180 Hz typical
-    return 200  # Default when disabled
+    if ftzFreq2 is None:
+        ftzFreq2 = calc_ftzFreq2(phoneme_data)
+    return _ftzBw2(ftzFreq2)
 
 
 def calc_sinusoidalVoicing(phoneme_data):
@@ -126,22 +176,8 @@ def calc_sinusoidalVoicing(phoneme_data):
     Returns:
         float: sinusoidalVoicingAmplitude (0-1 normalized)
     """
-    is_voiced = phoneme_data.get('_isVoiced', False)
-
-    if not is_voiced:
-        return 0.0
-
-    # Voiced fricatives: strong voicebar component
-    frication = phoneme_data.get('fricationAmplitude', 0)
-    if frication > 0.5:
-        return 0.35  # Prominent voicebar for /v/, /z/, /ʒ/, etc.
-
-    # Voiced stops during closure: mild voicebar
-    if phoneme_data.get('_isStop'):
-        return 0.25  # Voice bar visible in spectrogram
-
-    # Vowels, nasals, liquids: use complex LF glottal model instead
-    return 0.0
+    return _sinusoidalVoicing(phoneme_data.get('_isVoiced', False), phoneme_data.get('_isStop'),
+                              phoneme_data.get('fricationAmplitude', 0))
 
 
 def calc_aspirationFilterFreq(phoneme_data):
@@ -157,36 +193,24 @@ def calc_aspirationFilterFreq(phoneme_data):
     Returns:
         float: aspirationFilterFreq in Hz (0 = white noise)
     """
-    aspiration = phoneme_data.get('aspirationAmplitude', 0)
+    return _aspirationFilterFreq(phoneme_data.get('aspirationAmplitude', 0),
+                                 phoneme_data.get('_isStop'), phoneme_data.get('_isVoiced'))
 
-    if aspiration <= 0:
-        return 0  # No aspiration = no filter needed
 
-    # Voiceless stops: use white noise (unfiltered)
-    if phoneme_data.get('_isStop') and not phoneme_data.get('_isVoiced'):
-        return 0
-
-    # High aspiration (/h/, breathy voice): mid-frequency emphasis
-    if aspiration > 0.3:
-        return 1500  # Glottal aspiration spectral peak
-
-    return 0  # Default: white noise
-
-
-def calc_aspirationFilterBw(phoneme_data):
+def calc_aspirationFilterBw(phoneme_data, freq=None):
     """
     Calculate aspiration bandpass filter bandwidth.
 
     Args:
         phoneme_data: Dictionary with phoneme parameters
+        freq: Previously calculated aspirationFilterFreq value (calculated if None)
 
     Returns:
         float: aspirationFilterBw in Hz
     """
-    freq = calc_aspirationFilterFreq(phoneme_data)
-    if freq > 0:
-        return 2000  # Broad filter for natural aspiration
-    return 2000  # Default bandwidth
+    if freq is None:
+        freq = calc_aspirationFilterFreq(phoneme_data)
+    return _aspirationFilterBw(freq)
 
 
 def update_phoneme_with_new_params(phoneme_data):
@@ -205,19 +229,40 @@ def update_phoneme_with_new_params(phoneme_data):
     Returns:
         dict: Updated phoneme_data with new parameters added
     """
+    # Read the inputs once; the calculations below share them
+    get = phoneme_data.get
+    phonemeClass = _phonemeClass(get('_isNasal'), get('_isVowel'), get('_isLiquid'))
+    isStop = get('_isStop')
+    isVoiced = get('_isVoiced', False)
+
     # Calculate deltaF1 first (deltaB1 depends on it)
-    deltaF1 = calc_deltaF1(phoneme_data)
+    deltaF1 = _deltaF1(get('cf1', 500), phonemeClass)
 
-    # Add new parameters, preserving manually set values (non-zero)
-    phoneme_data.setdefault('deltaF1', deltaF1)
+    # Add new parameters, preserving manually set values (non-zero).
+    # Each calc only runs when its key is missing, unlike setdefault()
+    # which would evaluate it for every phoneme.
+    if 'deltaF1' not in phoneme_data:
+        phoneme_data['deltaF1'] = deltaF1
     # Preserve deltaB1 if manually set to a significant value (> 50 Hz)
-    if phoneme_data.get('deltaB1', 0) <= 50:
-        phoneme_data['deltaB1'] = calc_deltaB1(phoneme_data, deltaF1)
-    phoneme_data.setdefault('ftzFreq2', calc_ftzFreq2(phoneme_data))
-    phoneme_data.setdefault('ftzBw2', calc_ftzBw2(phoneme_data))
-    phoneme_data.setdefault('sinusoidalVoicingAmplitude', calc_sinusoidalVoicing(phoneme_data))
-    phoneme_data.setdefault('aspirationFilterFreq', calc_aspirationFilterFreq(phoneme_data))
-    phoneme_data.setdefault('aspirationFilterBw', calc_aspirationFilterBw(phoneme_data))
+    if get('deltaB1', 0) <= 50:
+        phoneme_data['deltaB1'] = _deltaB1(deltaF1, phonemeClass)
+    # The bandwidths are derived from the calculated frequencies, so
+    # work those out once and hand them on
+    if 'ftzFreq2' not in phoneme_data or 'ftzBw2' not in phoneme_data:
+        ftzFreq2 = _ftzFreq2(get('ftpFreq2', 0))
+        if 'ftzFreq2' not in phoneme_data:
+            phoneme_data['ftzFreq2'] = ftzFreq2
+        if 'ftzBw2' not in phoneme_data:
+            phoneme_data['ftzBw2'] = _ftzBw2(ftzFreq2)
+    if 'sinusoidalVoicingAmplitude' not in phoneme_data:
+        phoneme_data['sinusoidalVoicingAmplitude'] = _sinusoidalVoicing(
+            isVoiced, isStop, get('fricationAmplitude', 0))
+    if 'aspirationFilterFreq' not in phoneme_data or 'aspirationFilterBw' not in phoneme_data:
+        aspirationFilterFreq = _aspirationFilterFreq(get('aspirationAmplitude', 0), isStop, isVoiced)
+        if 'aspirationFilterFreq' not in phoneme_data:
+            phoneme_data['aspirationFilterFreq'] = aspirationFilterFreq
+        if 'aspirationFilterBw' not in phoneme_data:
+            phoneme_data['aspirationFilterBw'] = _aspirationFilterBw(aspirationFilterFreq)
 
     return phoneme_data
 
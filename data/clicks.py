@@ -12,8 +12,10 @@ Each click is a 2-phase stop:
   Phase 2: Velar release — short (5-8ms), lower burst mimicking the velar back-release
 """
 
-# Shared base parameters for all clicks
-_CLICK_BASE = {
+from types import MappingProxyType
+
+# Shared base parameters for all clicks (read-only; each click gets its own copy)
+_CLICK_BASE = MappingProxyType({
 	'_isNasal': False,
 	'_isStop': True,
 	'_isLiquid': False,
@@ -69,7 +71,7 @@ _CLICK_BASE = {
 	'ftzBw1': 100,
 	'ftpFreq2': 0,
 	'ftpBw2': 100,
-}
+})
 
 
 def _make_click(burst_freq, burst_bw):
@@ -13,16 +13,16 @@ Each diphthong entry contains:
 - _components tuple for parser expansion
 """
 
+from collections import ChainMap
+
 # Import vowel data to get formant values
 from .vowels_front import VOWELS_FRONT
 from .vowels_central import VOWELS_CENTRAL
 from .vowels_back import VOWELS_BACK
 
-# Merge all vowels for lookup
-_ALL_VOWELS = {}
-_ALL_VOWELS.update(VOWELS_FRONT)
-_ALL_VOWELS.update(VOWELS_CENTRAL)
-_ALL_VOWELS.update(VOWELS_BACK)
+# All vowels for lookup, without copying them into a merged dict
+# (first mapping wins, so back > central > front as with successive updates)
+_ALL_VOWELS = ChainMap(VOWELS_BACK, VOWELS_CENTRAL, VOWELS_FRONT)
 
 # Diphthong definitions: maps IPA diphthong to component vowels
 DIPHTHONG_COMPONENTS = {
@@ -14,6 +14,13 @@ VOWEL_CLASSES = {
     '-FRONT,-ROUND': ['ə', 'ʌ', 'ɑ', 'a', 'ɐ', 'ɨ', 'ʉ', 'ɜ', 'ɘ'],
 }
 
+# Vowel -> class; a vowel listed under several classes keeps the first
+_VOWEL_TO_CLASS = {}
+for _cls, _vowels in VOWEL_CLASSES.items():
+    for _vowel in _vowels:
+        _VOWEL_TO_CLASS.setdefault(_vowel, _cls)
+del _cls, _vowels, _vowel
+
 # Transition durations by phoneme class pair (milliseconds)
 # Based on acoustic phonetics literature
 TRANSITION_DURATIONS = {
@@ -44,6 +51,28 @@ TRANSITION_DURATIONS = {
     'default': 20,
 }
 
+# Class ids indexing _DURATION_TABLE. Stops, fricatives and nasals come
+# first: those are the classes whose place pulls the neighbouring vowel's
+# formants (see apply_coarticulation).
+_CLASS_IDS = {
+    'stop': 0, 'fricative': 1, 'nasal': 2,
+    'liquid': 3, 'semivowel': 4, 'vowel': 5, 'other': 6,
+}
+_LOCUS_CLASS_LIMIT = 3
+
+# Consonants given the slow retroflex F2 transition in apply_coarticulation
+_RETROFLEX = frozenset(('ʈ', 'ɖ', 'ɳ', 'ʂ', 'ʐ', 'ɭ'))
+
+# TRANSITION_DURATIONS as a [from_id][to_id] table, so a lookup is two
+# list indexes instead of building and hashing a tuple key
+_DURATION_TABLE = tuple(
+    tuple(
+        TRANSITION_DURATIONS.get((from_class, to_class), TRANSITION_DURATIONS['default'])
+        for to_class in _CLASS_IDS
+    )
+    for from_class in _CLASS_IDS
+)
+
 # F2 locus frequencies by consonant place (Hz)
 # These are the "target" F2 values consonants pull vowels toward
 # From Klatt 1987 and acoustic phonetics literature
@@ -122,6 +151,14 @@ PHONEME_PLACE = {
     'ʘ': 'velar', 'ǀ': 'velar', 'ǃ': 'velar', 'ǂ': 'velar', 'ǁ': 'velar',
 }
 
+# Symbol -> F2 locus, resolved through PHONEME_PLACE and F2_LOCUS once.
+# Glottals map to None like unknown symbols: they have no locus effect.
+_PHONEME_F2_LOCUS = {symbol: F2_LOCUS.get(place) for symbol, place in PHONEME_PLACE.items()}
+
+# Locus equation undershoot for CV onsets and VC offsets
+_ONSET_K = 0.75
+_OFFSET_K = 0.5
+
 
 def get_vowel_class(vowel_symbol):
     """
@@ -129,10 +166,7 @@ def get_vowel_class(vowel_symbol):
 
     Returns: '+FRONT', '+ROUND', or '-FRONT,-ROUND'
     """
-    for cls, vowels in VOWEL_CLASSES.items():
-        if vowel_symbol in vowels:
-            return cls
-    return '-FRONT,-ROUND'  # Default for unknown vowels
+    return _VOWEL_TO_CLASS.get(vowel_symbol, '-FRONT,-ROUND')  # Default for unknown vowels
 
 
 def get_phoneme_class(phoneme):
@@ -179,7 +213,36 @@ def get_consonant_place(phoneme):
     return PHONEME_PLACE.get(symbol)
 
 
-def calculate_formant_onset(consonant, vowel, k=0.75):
+def _locus_formants(consonant, vowel, k):
+    """
+    Return (F2, F3) pulled from the vowel toward the consonant, or None
+    for each formant that doesn't apply. Shared by the onset and offset
+    calculations, which differ only in k.
+    """
+    # Get F2 locus for the consonant's place; glottals don't affect
+    # formant transitions
+    f2_locus = _PHONEME_F2_LOCUS.get(consonant.get('_char', ''))
+    if not f2_locus:
+        return None, None
+
+    f2 = None
+    vowel_f2 = vowel.get('cf2', 0)
+    if vowel_f2:
+        f2 = f2_locus + k * (vowel_f2 - f2_locus)
+
+    # F3 is less affected but still shows coarticulation
+    # Use consonant's F3 as pseudo-locus
+    f3 = None
+    consonant_f3 = consonant.get('cf3', 0)
+    vowel_f3 = vowel.get('cf3', 0)
+    if consonant_f3 and vowel_f3:
+        # F3 transitions are typically faster (higher k)
+        f3 = consonant_f3 + 0.85 * (vowel_f3 - consonant_f3)
+
+    return f2, f3
+
+
+def calculate_formant_onset(consonant, vowel, k=_ONSET_K):
     """
     Apply Klatt locus equation to calculate vowel onset formants.
 
@@ -199,37 +262,15 @@ def calculate_formant_onset(consonant, vowel, k=0.75):
         dict: onset formant values with '_onset_' prefix
     """
     onset = {}
-
-    # Get consonant place for locus lookup
-    place = get_consonant_place(consonant)
-    if not place or place == 'glottal':
-        # Glottals don't affect formant transitions
-        return onset
-
-    # Get F2 locus for this place
-    f2_locus = F2_LOCUS.get(place)
-    if not f2_locus:
-        return onset
-
-    # Calculate F2 onset
-    vowel_f2 = vowel.get('cf2', 0)
-    if vowel_f2:
-        onset_f2 = f2_locus + k * (vowel_f2 - f2_locus)
+    onset_f2, onset_f3 = _locus_formants(consonant, vowel, k)
+    if onset_f2 is not None:
         onset['_onset_cf2'] = onset_f2
-
-    # F3 is less affected but still shows coarticulation
-    # Use consonant's F3 as pseudo-locus
-    consonant_f3 = consonant.get('cf3', 0)
-    vowel_f3 = vowel.get('cf3', 0)
-    if consonant_f3 and vowel_f3:
-        # F3 transitions are typically faster (higher k)
-        onset_f3 = consonant_f3 + 0.85 * (vowel_f3 - consonant_f3)
+    if onset_f3 is not None:
         onset['_onset_cf3'] = onset_f3
-
     return onset
 
 
-def calculate_formant_offset(consonant, vowel, k=0.5):
+def calculate_formant_offset(consonant, vowel, k=_OFFSET_K):
     """
     Apply Klatt locus equation to calculate vowel offset formants (VC direction).
 
@@ -248,28 +289,11 @@ def calculate_formant_offset(consonant, vowel, k=0.5):
         dict: offset formant values with '_offset_' prefix
     """
     offset = {}
-
-    place = get_consonant_place(consonant)
-    if not place or place == 'glottal':
-        return offset
-
-    f2_locus = F2_LOCUS.get(place)
-    if not f2_locus:
-        return offset
-
-    # Calculate F2 offset
-    vowel_f2 = vowel.get('cf2', 0)
-    if vowel_f2:
-        offset_f2 = f2_locus + k * (vowel_f2 - f2_locus)
+    offset_f2, offset_f3 = _locus_formants(consonant, vowel, k)
+    if offset_f2 is not None:
         offset['_offset_cf2'] = offset_f2
-
-    # F3 offset using consonant's F3 as pseudo-locus
-    consonant_f3 = consonant.get('cf3', 0)
-    vowel_f3 = vowel.get('cf3', 0)
-    if consonant_f3 and vowel_f3:
-        offset_f3 = consonant_f3 + 0.85 * (vowel_f3 - consonant_f3)
+    if offset_f3 is not None:
         offset['_offset_cf3'] = offset_f3
-
     return offset
 
 
@@ -285,13 +309,9 @@ def get_transition_duration(from_phoneme, to_phoneme, speed=1.0):
     Returns:
         float: transition duration in milliseconds (scaled by speed)
     """
-    from_class = get_phoneme_class(from_phoneme)
-    to_class = get_phoneme_class(to_phoneme)
-
-    key = (from_class, to_class)
-    duration = TRANSITION_DURATIONS.get(key, TRANSITION_DURATIONS['default'])
-
-    return duration / speed
+    from_id = _CLASS_IDS[get_phoneme_class(from_phoneme)]
+    to_id = _CLASS_IDS[get_phoneme_class(to_phoneme)]
+    return _DURATION_TABLE[from_id][to_id] / speed
 
 
 def apply_coarticulation(phonemeList, baseSpeed=1.0):
@@ -308,41 +328,43 @@ def apply_coarticulation(phonemeList, baseSpeed=1.0):
         phonemeList: list of phoneme dicts (modified in place)
         baseSpeed: speech rate multiplier
     """
-    final_index = len(phonemeList) - 1
-
-    for i, phoneme in enumerate(phonemeList):
-        # Skip silence markers
-        if phoneme.get('_silence'):
-            continue
-
-        prev = phonemeList[i - 1] if i > 0 else None
-
-        # Skip if no previous phoneme or previous is silence
-        if not prev or prev.get('_silence'):
+    # Classes only depend on the _is* flags and fricationAmplitude, which
+    # nothing below changes, so classify every phoneme once up front.
+    # They are not stamped into the phoneme dicts because ipa.py modifiers
+    # and the editor change those flags on their own copies.
+    class_ids = [_CLASS_IDS[get_phoneme_class(phoneme)] for phoneme in phonemeList]
+
+    # The first phoneme has no predecessor, so walk (prev, phoneme) pairs
+    for i, (prev, phoneme) in enumerate(zip(phonemeList, phonemeList[1:]), 1):
+        # Skip silence markers, and phonemes following silence
+        if phoneme.get('_silence') or not prev or prev.get('_silence'):
             continue
 
         # CV transition: Apply locus equation to vowel onset
         if phoneme.get('_isVowel'):
             # Find the consonant for locus calculation
             # Look past post-stop aspiration to find the actual stop
-            consonant = prev
+            consonant_index = i - 1
             if prev.get('_postStopAspiration') and i >= 2:
-                consonant = phonemeList[i - 2]
+                consonant_index = i - 2
+            consonant = phonemeList[consonant_index]
 
-            prev_class = get_phoneme_class(consonant)
             # Apply coarticulation for obstruent -> vowel transitions
-            if prev_class in ('stop', 'fricative', 'nasal'):
-                onset = calculate_formant_onset(consonant, phoneme)
-                phoneme.update(onset)
+            # (written straight into the phoneme, no intermediate dict)
+            if class_ids[consonant_index] < _LOCUS_CLASS_LIMIT:
+                onset_f2, onset_f3 = _locus_formants(consonant, phoneme, _ONSET_K)
+                if onset_f2 is not None:
+                    phoneme['_onset_cf2'] = onset_f2
+                if onset_f3 is not None:
+                    phoneme['_onset_cf3'] = onset_f3
 
             # Retroflex consonants have SLOWEST F2 transition (Agrawal Table IV)
-            consonant_char = consonant.get('_char', '')
-            if consonant_char in ['ʈ', 'ɖ', 'ɳ', 'ʂ', 'ʐ', 'ɭ']:
+            if consonant.get('_char', '') in _RETROFLEX:
                 phoneme['_fadeDuration'] = 60 / baseSpeed
                 continue  # Skip normal duration calculation
 
         # Update transition duration based on phoneme class pair
-        duration = get_transition_duration(prev, phoneme, baseSpeed)
+        duration = _DURATION_TABLE[class_ids[i - 1]][class_ids[i]] / baseSpeed
         phoneme['_fadeDuration'] = duration
 
     # VC transitions: Apply locus equation to vowel offset (before stop closure)
@@ -358,10 +380,13 @@ def apply_coarticulation(phonemeList, baseSpeed=1.0):
                 continue  # Skip the silent gap
             if candidate.get('_isStop') or candidate.get('_isAfricate') or candidate.get('fricationAmplitude', 0) > 0:
                 next_consonant = candidate
+                next_class_id = class_ids[j]
             break
 
         if next_consonant:
-            next_class = get_phoneme_class(next_consonant)
-            if next_class in ('stop', 'fricative', 'nasal'):
-                offset = calculate_formant_offset(next_consonant, phoneme)
-                phoneme.update(offset)
+            if next_class_id < _LOCUS_CLASS_LIMIT:
+                offset_f2, offset_f3 = _locus_formants(next_consonant, phoneme, _OFFSET_K)
+                if offset_f2 is not None:
+                    phoneme['_offset_cf2'] = offset_f2
+                if offset_f3 is not None:
+                    phoneme['_offset_cf3'] = offset_f3
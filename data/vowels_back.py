@@ -10,6 +10,8 @@ Voice quality is controlled by lfRd parameter (LF model):
 - lfRd = 0: No voicing (voiceless consonants only)
 """
 
+from ._defaults import NASAL_OFF_CB, NASAL_OFF_CF, TRACHEAL_OFF
+
 VOWELS_BACK = {
 	'u': {  # Close back rounded
 		'_isNasal': False,
@@ -33,17 +35,14 @@ VOWELS_BACK = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 90,   # Widened from 60 — 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 139,   # Q=6.26 (narrowed ×0.80 for clarity)
 		'cb3': 368,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 300,
 		'pf2': 870,
@@ -66,12 +65,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.5,  # Raised for parallel HF
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ʊ': {  # Near-close back rounded
 		'_isNasal': False,
@@ -95,17 +89,14 @@ VOWELS_BACK = {
 		'cf4': 3500,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 168,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 368,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 700,   # Q=5.0 (cf4/5.0 = 3500/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 450,
 		'pf2': 1050,
@@ -128,12 +119,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.5,  # Raised for parallel HF
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'o': {  # Close-mid back rounded
 		'_isNasal': False,
@@ -159,17 +145,14 @@ VOWELS_BACK = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 64,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 218,   # Q=4.0 (skip — intentionally wide for back vowel F2)
 		'cb3': 384,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 400,
 		'pf2': 870,
@@ -192,12 +175,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.5,  # Raised for parallel HF
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɔ': {  # Open-mid back rounded
 		'_isNasal': False,
@@ -223,17 +201,14 @@ VOWELS_BACK = {
 		'cf4': 3100,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 96,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 220,  # Q=4.0 (skip — intentionally wide for back vowel F2)
 		'cb3': 408,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 620,   # Q=5.0 (cf4/5.0 = 3100/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 600,
 		'pf2': 880,
@@ -256,12 +231,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.5,  # Raised for parallel HF
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɑ': {  # Open back unrounded
 		'_isNasal': False,
@@ -287,17 +257,14 @@ VOWELS_BACK = {
 		'cf4': 3000,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 118,   # Q=6.27 (narrowed ×0.80 for clarity)
 		'cb2': 288,  # Q=4.0 (skip — intentionally wide for back vowel F2)
 		'cb3': 408,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 600,   # Q=5.0 (cf4/5.0 = 3000/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 740,
 		'pf2': 1150,
@@ -320,12 +287,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.35,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɒ': {  # Open back rounded
 		'_isNasal': False,
@@ -351,17 +313,14 @@ VOWELS_BACK = {
 		'cf4': 3000,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 99,   # Q=6.26 (narrowed ×0.80 for clarity)
 		'cb2': 275,  # Q=4.0 (skip — intentionally wide for back vowel F2)
 		'cb3': 403,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 600,   # Q=5.0 (cf4/5.0 = 3000/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 620,
 		'pf2': 1100,
@@ -384,12 +343,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.5,  # Raised for parallel HF
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɯ': {  # Close back unrounded
 		'_isNasal': False,
@@ -413,17 +367,14 @@ VOWELS_BACK = {
 		'cf4': 3500,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 90,   # Widened from 60 — 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 192,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 336,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 700,   # Q=5.0 (cf4/5.0 = 3500/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 300,
 		'pf2': 1200,
@@ -446,12 +397,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.37,  # Halved from 0.73
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɤ': {  # Close-mid back unrounded
 		'_isNasal': False,
@@ -477,17 +423,14 @@ VOWELS_BACK = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # 4th-order F1 needs cb1≥80 for close-mid vowels
 		'cb2': 192,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 408,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 460,
 		'pf2': 1200,
@@ -510,12 +453,7 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.39,  # Halved from 0.77
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ʌ': {  # Open-mid back unrounded (STRUT vowel)
 		'_isNasal': False,
@@ -541,17 +479,14 @@ VOWELS_BACK = {
 		'cf4': 3100,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 99,   # Q=6.26 (narrowed ×0.80 for clarity)
 		'cb2': 195,  # Q=6.26 (narrowed ×0.80 for clarity)
 		'cb3': 408,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 620,   # Q=5.0 (cf4/5.0 = 3100/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 620,
 		'pf2': 1220,
@@ -574,11 +509,6 @@ VOWELS_BACK = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.21,  # Halved from 0.42
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 }
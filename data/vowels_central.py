@@ -10,6 +10,8 @@ Voice quality is controlled by lfRd parameter (LF model):
 - lfRd = 0: No voicing (voiceless consonants only)
 """
 
+from ._defaults import NASAL_OFF_CB, NASAL_OFF_CF, TRACHEAL_OFF
+
 VOWELS_CENTRAL = {
 	'ə': {  # Mid central (schwa) - most common vowel in English
 		'_isNasal': False,
@@ -35,17 +37,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 232,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 392,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 500,
 		'pf2': 1450,
@@ -68,12 +67,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.8,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɜ': {  # Open-mid central unrounded (NURSE vowel)
 		'_isNasal': False,
@@ -99,17 +93,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 224,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 368,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 500,
 		'pf2': 1400,
@@ -132,12 +123,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.77,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɞ': {  # Open-mid central rounded
 		'_isNasal': False,
@@ -163,17 +149,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 216,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 336,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 500,
 		'pf2': 1350,
@@ -196,12 +179,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.68,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɐ': {  # Near-open central
 		'_isNasal': False,
@@ -227,17 +205,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3000,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 104,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 210,  # Q=6.24 (narrowed ×0.80 for clarity)
 		'cb3': 384,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 600,   # Q=5.0 (cf4/5.0 = 3000/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 650,
 		'pf2': 1310,
@@ -260,12 +235,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.39,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɨ': {  # Close central unrounded
 		'_isNasal': False,
@@ -289,17 +259,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 90,   # Widened from 60 — 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 256,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 400,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 300,
 		'pf2': 1600,
@@ -322,12 +289,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.6,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ʉ': {  # Close central rounded
 		'_isNasal': False,
@@ -351,17 +313,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3100,
 		'cf5': 3500,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 90,   # Widened from 64 — 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 280,  # Q=6.25 (1750/6.25)
 		'cb3': 392,  # Q=6.25 (2450/6.25)
 		'cb4': 620,   # Q=5.0 (cf4/5.0 = 3100/5.0)
 		'cb5': 700,   # Q=5.0 (cf5/5.0 = 3500/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 320,
 		'pf2': 1750,
@@ -384,12 +343,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.7,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɘ': {  # Close-mid central unrounded
 		'_isNasal': False,
@@ -415,17 +369,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 64,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 240,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 384,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 400,
 		'pf2': 1500,
@@ -448,12 +399,7 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.74,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɵ': {  # Close-mid central rounded
 		'_isNasal': False,
@@ -479,17 +425,14 @@ VOWELS_CENTRAL = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 64,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 224,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 352,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,   # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,   # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 400,
 		'pf2': 1400,
@@ -512,11 +455,6 @@ VOWELS_CENTRAL = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.75,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 }
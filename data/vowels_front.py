@@ -10,6 +10,8 @@ Voice quality is controlled by lfRd parameter (LF model):
 - lfRd = 0: No voicing (voiceless consonants only)
 """
 
+from ._defaults import NASAL_OFF_CB, NASAL_OFF_CF, TRACHEAL_OFF
+
 VOWELS_FRONT = {
 	'a': {  # Open front unrounded
 		'_isNasal': False,
@@ -102,17 +104,14 @@ VOWELS_FRONT = {
 		'cf4': 3800,
 		'cf5': 4156,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 65,  # Narrowed F1 bandwidth (Q≈4.3) — sharper peak for LPC accuracy at F0=120 Hz
 		'cb2': 400,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 512,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 760,   # Q=5.0 (cf4/5.0 = 3800/5.0)
 		'cb5': 831,   # Q=5.0 (cf5/5.0 = 4156/5.0)
 		'cb6': 980,   # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 280,
 		'pf2': 2500,
@@ -166,17 +165,14 @@ VOWELS_FRONT = {
 		'cf4': 3500,
 		'cf5': 5000,
 		'cf6': 5400,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 64,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 368,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 480,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 700,   # Q=5.0 (cf4/5.0 = 3500/5.0)
 		'cb5': 1000,  # Q=5.0 (cf5/5.0 = 5000/5.0)
 		'cb6': 1080,  # Q=5.0 (cf6/5.0 = 5400/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 400,
 		'pf2': 2300,
@@ -199,12 +195,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.65,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɪ': {  # Near-close front unrounded (lax) - KIT vowel
 		'_isNasal': False,
@@ -228,17 +219,14 @@ VOWELS_FRONT = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 64,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 320,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 416,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,  # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 400,
 		'pf2': 2000,
@@ -261,12 +249,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.8,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɛ': {  # Open-mid front unrounded
 		'_isNasal': False,
@@ -292,17 +275,14 @@ VOWELS_FRONT = {
 		'cf4': 3100,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 88,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 301,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 405,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 620,  # Q=5.0 (cf4/5.0 = 3100/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 550,
 		'pf2': 1880,
@@ -325,12 +305,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.35,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'æ': {  # Near-open front unrounded (TRAP vowel)
 		'_isNasal': False,
@@ -356,17 +331,14 @@ VOWELS_FRONT = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 112,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 285,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 392,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,  # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 700,
 		'pf2': 1780,
@@ -389,12 +361,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.27,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'y': {  # Close front rounded
 		'_isNasal': False,
@@ -418,17 +385,14 @@ VOWELS_FRONT = {
 		'cf4': 2700,
 		'cf5': 4000,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,  # 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 304,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 336,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 540,  # Q=5.0 (cf4/5.0 = 2700/5.0)
 		'cb5': 800,  # Q=5.0 (cf5/5.0 = 4000/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 280,
 		'pf2': 1900,
@@ -451,12 +415,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.54,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ʏ': {  # Near-close front rounded
 		'_isNasal': False,
@@ -480,17 +439,14 @@ VOWELS_FRONT = {
 		'cf4': 3400,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 90,   # Widened from 72 — 4th-order F1 needs cb1≥80 for close vowels
 		'cb2': 272,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 352,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 680,  # Q=5.0 (cf4/5.0 = 3400/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 360,
 		'pf2': 1700,
@@ -513,12 +469,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.78,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ø': {  # Close-mid front rounded
 		'_isNasal': False,
@@ -544,17 +495,14 @@ VOWELS_FRONT = {
 		'cf4': 3300,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 64,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 256,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 384,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 660,  # Q=5.0 (cf4/5.0 = 3300/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 400,
 		'pf2': 1600,
@@ -577,12 +525,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.74,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'œ': {  # Open-mid front rounded
 		'_isNasal': False,
@@ -608,17 +551,14 @@ VOWELS_FRONT = {
 		'cf4': 3100,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 85,   # Q=6.24 (narrowed ×0.80 for clarity)
 		'cb2': 240,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 400,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 620,  # Q=5.0 (cf4/5.0 = 3100/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 530,
 		'pf2': 1500,
@@ -641,12 +581,7 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.74,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɶ': {  # Open front rounded
 		'_isNasal': False,
@@ -672,17 +607,14 @@ VOWELS_FRONT = {
 		'cf4': 3000,
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 112,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 256,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 400,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 600,  # Q=5.0 (cf4/5.0 = 3000/5.0)
 		'cb5': 750,  # Q=5.0 (cf5/5.0 = 3750/5.0)
 		'cb6': 980,  # Q=5.0 (cf6/5.0 = 4900/5.0)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		# Parallel formants - matched to cascade
 		'pf1': 700,
 		'pf2': 1600,
@@ -705,11 +637,6 @@ VOWELS_FRONT = {
 		'parallelBypass': 0,
 		'parallelVoiceMix': 0.39,  # Auto-tuned voice mix for parallel F2/F3
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 }
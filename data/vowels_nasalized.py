@@ -10,6 +10,8 @@ Voice quality is controlled by lfRd parameter (LF model):
 - lfRd = 0: No voicing (voiceless consonants only)
 """
 
+from ._defaults import TRACHEAL_OFF
+
 VOWELS_NASALIZED = {
 	'ã': {  # Nasalized low central
 		'_isNasal': False,
@@ -63,12 +65,7 @@ VOWELS_NASALIZED = {
 		'lfRd': 1.5,  # Open vowel — less breathy (was 2.0)
 		'diplophonia': 0,
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɛ̃': {  # Nasalized low-mid front
 		'_isNasal': False,
@@ -122,12 +119,7 @@ VOWELS_NASALIZED = {
 		'lfRd': 1.7,  # Open-mid — less breathy (was 2.3)
 		'diplophonia': 0,
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɔ̃': {  # Nasalized low-mid back
 		'_isNasal': False,
@@ -181,12 +173,7 @@ VOWELS_NASALIZED = {
 		'lfRd': 1.6,  # Open-mid — less breathy (was 2.0)
 		'diplophonia': 0,
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'œ̃': {  # Nasalized low-mid front rounded
 		'_isNasal': False,
@@ -240,11 +227,6 @@ VOWELS_NASALIZED = {
 		'lfRd': 1.7,  # Open-mid — less breathy (was 2.3)
 		'diplophonia': 0,
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 }
@@ -10,6 +10,8 @@ Voice quality is controlled by lfRd parameter (LF model):
 - lfRd = 0: No voicing (voiceless consonants only)
 """
 
+from ._defaults import NASAL_OFF_CB, NASAL_OFF_CF, TRACHEAL_OFF
+
 VOWELS_RCOLORED = {
 	'ɝ': {  # Stressed r-colored schwa (Stevens Table 9.2 - lowered F4)
 		'_isNasal': False,
@@ -27,17 +29,14 @@ VOWELS_RCOLORED = {
 		'cf4': 2900,  # Lowered F4 for r-coloring (Stevens)
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 216,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 264,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 725,  # Q=4.0 (was 967)
 		'cb5': 938,  # Q=4.0 (was 1250)
 		'cb6': 1225,  # Q=4.0 (was 1633)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		'pf1': 500,
 		'pf2': 1350,
 		'pf3': 1650,
@@ -64,12 +63,7 @@ VOWELS_RCOLORED = {
 		'lfRd': 1.7,  # Close-mid — moderate modality
 		'diplophonia': 0,
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 	'ɚ': {  # Unstressed r-colored schwa (Stevens Table 9.2 - lowered F4)
 		'_isNasal': False,
@@ -87,17 +81,14 @@ VOWELS_RCOLORED = {
 		'cf4': 2900,  # Lowered F4 for r-coloring (Stevens)
 		'cf5': 3750,
 		'cf6': 4900,
-		'cfNP': 200,
-		'cfN0': 250,
+		**NASAL_OFF_CF,
 		'cb1': 80,   # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb2': 224,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb3': 256,  # Q=6.25 (narrowed ×0.80 for clarity)
 		'cb4': 725,  # Q=4.0 (was 967)
 		'cb5': 938,  # Q=4.0 (was 1250)
 		'cb6': 1225,  # Q=4.0 (was 1633)
-		'cbNP': 100,
-		'cbN0': 100,
-		'caNP': 0,
+		**NASAL_OFF_CB,
 		'pf1': 500,
 		'pf2': 1400,
 		'pf3': 1600,
@@ -124,11 +115,6 @@ VOWELS_RCOLORED = {
 		'lfRd': 1.7,  # Close-mid — moderate modality
 		'diplophonia': 0,
 		# Tracheal formants
-		'ftpFreq1': 0,
-		'ftpBw1': 100,
-		'ftzFreq1': 0,
-		'ftzBw1': 100,
-		'ftpFreq2': 0,
-		'ftpBw2': 100,
+		**TRACHEAL_OFF,
 	},
 }
@@ -1,11 +1,10 @@
 """Audio playback and live preview management for the phoneme editor."""
 
+import array
 import threading
 import time
 import wave
-import struct
-import tempfile
-import os
+import io
 import re
 from pathlib import Path
 
@@ -98,17 +97,12 @@ class AudioManager:
             sp.queueFrame(frame, duration_ms, min(50, duration_ms // 2))
             sp.queueFrame(None, 50, 20)
 
-            all_samples = []
+            all_samples = array.array('h')
             while self.is_playing:
                 samples = sp.synthesize(8192)
-                if samples and hasattr(samples, 'length') and samples.length > 0:
-                    all_samples.extend(samples[:samples.length])
-                elif samples:
-                    all_samples.extend(samples[:])
-                    if len(samples) < 8192:
-                        break
-                else:
+                if not samples:
                     break
+                all_samples.frombytes(memoryview(samples).cast('B')[:samples.length * 2])
 
             if not self.is_playing or not all_samples:
                 return
@@ -167,17 +161,12 @@ class AudioManager:
 
             sp.queueFrame(None, 50, 20)
 
-            all_samples = []
+            all_samples = array.array('h')
             while self.is_playing:
                 samples = sp.synthesize(8192)
-                if samples and hasattr(samples, 'length') and samples.length > 0:
-                    all_samples.extend(samples[:samples.length])
-                elif samples:
-                    all_samples.extend(samples[:])
-                    if len(samples) < 8192:
-                        break
-                else:
+                if not samples:
                     break
+                all_samples.frombytes(memoryview(samples).cast('B')[:samples.length * 2])
 
             if not self.is_playing or not all_samples:
                 return
@@ -322,21 +311,12 @@ class AudioManager:
 
         def audio_callback(outdata, frames, time_info, status):
             samples = self._live_sp.synthesize(frames)
-            if samples and hasattr(samples, 'length') and samples.length > 0:
+            if samples:
                 count = min(samples.length, frames)
-                for i in range(count):
-                    outdata[i][0] = samples[i]
-                for i in range(count, frames):
-                    outdata[i][0] = 0
-            elif samples:
-                count = min(len(samples), frames)
-                for i in range(count):
-                    outdata[i][0] = samples[i]
-                for i in range(count, frames):
-                    outdata[i][0] = 0
+                outdata[:count, 0] = memoryview(samples)[:count]
+                outdata[count:] = 0
             else:
-                for i in range(frames):
-                    outdata[i][0] = 0
+                outdata.fill(0)
                 wx.CallAfter(self._queue_live_frame)
 
         self._live_stream = sd.OutputStream(
@@ -498,17 +478,12 @@ class AudioManager:
 
             sp.queueFrame(None, 50, 20)
 
-            all_samples = []
+            all_samples = array.array('h')
             while self.is_playing:
                 samples = sp.synthesize(8192)
-                if samples and hasattr(samples, 'length') and samples.length > 0:
-                    all_samples.extend(samples[:samples.length])
-                elif samples:
-                    all_samples.extend(samples[:])
-                    if len(samples) < 8192:
-                        break
-                else:
+                if not samples:
                     break
+                all_samples.frombytes(memoryview(samples).cast('B')[:samples.length * 2])
 
             if not self.is_playing or not all_samples:
                 return
@@ -612,17 +587,12 @@ class AudioManager:
 
                 sp.queueFrame(None, 50, 20)
 
-                all_samples = []
+                all_samples = array.array('h')
                 while self.is_playing and self._is_looping:
                     samples = sp.synthesize(8192)
-                    if samples and hasattr(samples, 'length') and samples.length > 0:
-                        all_samples.extend(samples[:samples.length])
-                    elif samples:
-                        all_samples.extend(samples[:])
-                        if len(samples) < 8192:
-                            break
-                    else:
+                    if not samples:
                         break
+                    all_samples.frombytes(memoryview(samples).cast('B')[:samples.length * 2])
 
                 if not self.is_playing or not self._is_looping or not all_samples:
                     break
@@ -697,18 +667,36 @@ class AudioManager:
         self._frame.header_panel.stop_btn.Enable(playing)
 
     def _play_wav(self, all_samples):
-        """Write samples to a temp WAV and play with winsound."""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            tmp_path = tmp.name
-        with wave.open(tmp_path, 'wb') as wav:
+        """Play an int16 array of samples, streaming through sounddevice when available.
+
+        Falls back to building the WAV in memory and playing it with winsound.
+        """
+        if HAS_SOUNDDEVICE:
+            self._play_stream(all_samples)
+            return
+
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, 'wb') as wav:
             wav.setnchannels(1)
             wav.setsampwidth(2)
             wav.setframerate(self.sample_rate)
-            wav.writeframes(struct.pack('<%dh' % len(all_samples), *all_samples))
+            wav.setnframes(len(all_samples))  # Header is final, no patch on close
+            wav.writeframes(all_samples)
 
         if self.is_playing and HAS_WINSOUND:
-            winsound.PlaySound(tmp_path, winsound.SND_FILENAME)
-        try:
-            os.unlink(tmp_path)
-        except:
-            pass
+            winsound.PlaySound(wav_buffer.getvalue(), winsound.SND_MEMORY)
+
+    def _play_stream(self, all_samples):
+        """Play samples through a blocking sounddevice stream.
+
+        Written in small blocks so stop() takes effect mid-buffer, without
+        a temp file and on any platform PortAudio supports.
+        """
+        data = memoryview(all_samples).cast('B')
+        block = 4096 * 2  # bytes per write (4096 int16 samples)
+        with sd.RawOutputStream(samplerate=self.sample_rate, channels=1, dtype='int16') as stream:
+            for start in range(0, len(data), block):
+                if not self.is_playing:
+                    stream.abort()
+                    break
+                stream.write(data[start:start + block])
@@ -4,6 +4,8 @@ import time
 import wx
 import ipa_keyboard
 
+# Bare modifier presses never map to a shortcut or IPA symbol
+_MODIFIER_KEYS = ipa_keyboard.get_modifier_keys()
 
 class KeyboardManager:
     """Manages keyboard shortcuts and IPA cycling input."""
@@ -18,6 +20,9 @@ class KeyboardManager:
 
     def on_key(self, event):
         key = event.GetKeyCode()
+        if key in _MODIFIER_KEYS:
+            event.Skip()
+            return
 
         # IPA keyboard in sequence input
         if event.AltDown() and self._frame.sequence_input.HasFocus():
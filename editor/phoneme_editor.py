@@ -473,11 +473,13 @@ class PhonemeEditorFrame(wx.Frame):
 
 def main():
     app = wx.App()
-    try:
-        import ctypes
-        ctypes.windll.shcore.SetProcessDpiAwareness(1)
-    except:
-        pass
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        except (OSError, AttributeError):
+            # shcore is missing before Windows 8.1
+            pass
     frame = PhonemeEditorFrame()
     frame.Show()
     app.MainLoop()
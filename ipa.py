@@ -13,6 +13,7 @@
 ###
 
 import os
+import re
 import itertools
 import codecs
 try:
@@ -201,6 +202,27 @@ COMBINING_DIACRITICS = {
 # Exclude ʼ from skip set so _findLongestPhoneme can match ejective entries (e.g. "pʼ")
 _SKIP_IN_MULTICHAR = set('ˈˌː͡ ') | set(TONE_DIACRITICS.keys()) | set(TONE_LETTERS.keys()) | (set(CONSONANT_MODIFIERS.keys()) - {'ʼ'}) | set(COMBINING_DIACRITICS.keys())
 
+def _buildMultiCharPattern():
+	"""Compile one alternation of all multi-character phoneme keys.
+
+	Keys are sorted longest first so a regex match at a position yields the
+	longest phoneme starting there. Keys containing characters from
+	_SKIP_IN_MULTICHAR are left out, as _findLongestPhoneme never matches them.
+	"""
+	keys = [k for k in data if 2 <= len(k) <= 4 and not any(c in _SKIP_IN_MULTICHAR for c in k)]
+	keys.sort(key=len, reverse=True)
+	return re.compile('|'.join(re.escape(k) for k in keys))
+
+# Built once from the keys in data at import (after any JSON overlay has
+# been merged). Code that adds or removes phoneme keys later must call
+# rebuildMultiCharPattern() for the new keys to be matched.
+_MULTICHAR_RE = _buildMultiCharPattern()
+
+def rebuildMultiCharPattern():
+	"""Recompile the multi-character phoneme pattern after data keys change."""
+	global _MULTICHAR_RE
+	_MULTICHAR_RE = _buildMultiCharPattern()
+
 def _findLongestPhoneme(text, index, maxLen=4):
 	"""Try to match the longest phoneme starting at index.
 
@@ -215,15 +237,22 @@ def _findLongestPhoneme(text, index, maxLen=4):
 	Returns:
 		tuple: (matched_string, phoneme_data, length) or (None, None, 0) if no match
 	"""
-	remaining = len(text) - index
-	for length in range(min(maxLen, remaining), 1, -1):  # Try longest first, down to 2
-		candidate = text[index:index + length]
-		# Skip if candidate contains special characters
-		if any(c in _SKIP_IN_MULTICHAR for c in candidate):
-			continue
-		phoneme = data.get(candidate)
-		if phoneme:
-			return candidate, phoneme, length
+	match = _MULTICHAR_RE.match(text, index)
+	if match:
+		candidate = match.group()
+		length = len(candidate)
+		if 2 <= length <= maxLen:
+			return candidate, data[candidate], length
+	if maxLen < 4:
+		# Shorter limit than the compiled pattern: try longest first, down to 2
+		for length in range(min(maxLen, len(text) - index), 1, -1):
+			candidate = text[index:index + length]
+			# Skip if candidate contains special characters
+			if any(c in _SKIP_IN_MULTICHAR for c in candidate):
+				continue
+			phoneme = data.get(candidate)
+			if phoneme:
+				return candidate, phoneme, length
 	return None, None, 0
 
 def _applySecondaryArticulation(phoneme, modifier):
@@ -1107,6 +1136,11 @@ def _compute_param_at_time(phoneme, param, t):
 	if onset_val is None and offset_val is None:
 		return target
 
+	return _blend_value(target, onset_val, offset_val, t)
+
+
+def _blend_value(target, onset_val, offset_val, t):
+	"""Blend a target value with its onset/offset annotations at time t."""
 	# Onset region: first 20% of phoneme
 	onset_end = 0.2
 	# Offset region: last 20% of phoneme
@@ -1122,16 +1156,33 @@ def _compute_param_at_time(phoneme, param, t):
 		return target
 
 
-def _preparePhonemeList(ipaText, speed, basePitch, inflection, clauseType):
+def parsePhonemes(ipaText):
+	"""Text-only stage of phoneme preparation: parse and h-correction.
+
+	Depends on nothing but the text, so a caller that speaks the same text
+	repeatedly with different speed or pitch can cache the result and pass
+	it back as parsedPhonemes. The later stages copy the phoneme dicts
+	before writing to them, so a cached result is never modified.
+	"""
+	phonemeList = IPAToPhonemes(ipaText)
+	correctHPhonemes(phonemeList)
+	return phonemeList
+
+
+def _preparePhonemeList(ipaText, speed, basePitch, inflection, clauseType, parsedPhonemes=None):
 	"""Phoneme preparation pipeline: timing, coarticulation, blending, pitch.
 
+	parsedPhonemes, if given, is the result of parsePhonemes(ipaText).
+
 	Returns the prepared phonemeList (modified in place with times, pitches,
 	coarticulation, cross-phoneme blending, etc.) or None if empty.
 	"""
-	phonemeList = IPAToPhonemes(ipaText)
+	if parsedPhonemes is None:
+		parsedPhonemes = parsePhonemes(ipaText)
+	# Later stages write into the dicts, so work on copies of the parse
+	phonemeList = [phoneme.copy() for phoneme in parsedPhonemes]
 	if len(phonemeList) == 0:
 		return None
-	correctHPhonemes(phonemeList)
 	calculatePhonemeTimes(phonemeList, speed)
 	transitions.apply_coarticulation(phonemeList, speed)
 	_blend_diphthong_voice_quality(phonemeList)
@@ -1153,7 +1204,7 @@ def _preparePhonemeList(ipaText, speed, basePitch, inflection, clauseType):
 
 def generateSubFramesAndTiming(ipaText, speed=1, basePitch=100, inflection=0.5, clauseType=None,
                                formantScale=1.0, spectralTilt=None, voiceTurbulence=None,
-                               flutter=None, subFrameMs=5.0):
+                               flutter=None, subFrameMs=5.0, parsedPhonemes=None):
 	"""Generate dense sub-frames from IPA text.
 
 	Subdivides each phoneme into short sub-frames (~5ms) with pre-computed
@@ -1179,8 +1230,10 @@ def generateSubFramesAndTiming(ipaText, speed=1, basePitch=100, inflection=0.5,
 		voiceTurbulence: Override voice turbulence amplitude 0-1
 		flutter: Override flutter amount for pitch jitter
 		subFrameMs: Sub-frame duration in milliseconds (default 5.0)
+		parsedPhonemes: Optional result of parsePhonemes(ipaText), to skip parsing
 	"""
-	phonemeList = _preparePhonemeList(ipaText, speed, basePitch, inflection, clauseType)
+	phonemeList = _preparePhonemeList(ipaText, speed, basePitch, inflection, clauseType,
+	                                  parsedPhonemes)
 	if phonemeList is None:
 		return
 
@@ -1211,30 +1264,42 @@ def generateSubFramesAndTiming(ipaText, speed=1, basePitch=100, inflection=0.5,
 				continue
 			baseParams[k] = v
 
+		# Apply the base params to a Frame once per phoneme; each sub-frame
+		# starts from a flat copy of it and only sets what varies over time
+		baseFrame = speechPlayer.Frame()
+		baseFrame.preFormantGain = 1.0
+		baseFrame.outputGain = 1.0
+		applyPhonemeToFrame(baseFrame, baseParams)
+
+		# The base frame already holds each interpolated param's target, so
+		# only params with onset/offset annotations need per-sub-frame work
+		blendedParams = []
+		for param in _INTERPOLATED_PARAMS:
+			target = phoneme.get(param)
+			if target is None:
+				continue
+			onset_val = phoneme.get(f'_onset_{param}')
+			offset_val = phoneme.get(f'_offset_{param}')
+			if onset_val is not None or offset_val is not None:
+				blendedParams.append((param, target, onset_val, offset_val))
+
 		for j in range(numSubFrames):
 			# Normalized time within this phoneme (0.0 to ~1.0)
 			t = j / max(1, numSubFrames)
 
 			# Start with base params (all non-pitch, non-private params)
-			subframeParams = baseParams.copy()
+			frame = speechPlayer.Frame.from_buffer_copy(baseFrame)
 
 			# Compute pitch at this time point
 			pitch = _compute_pitch_at_time(startPitch, endPitch, midPitch, t)
-			subframeParams['voicePitch'] = pitch
-			subframeParams['endVoicePitch'] = pitch  # No C++ pitch increment
-			subframeParams['midVoicePitch'] = 0
+			frame.voicePitch = pitch
+			frame.endVoicePitch = pitch  # No C++ pitch increment
+			frame.midVoicePitch = 0
 
 			# Compute interpolated parameter values (coarticulation + blending)
-			for param in _INTERPOLATED_PARAMS:
-				val = _compute_param_at_time(phoneme, param, t)
-				if val is not None:
-					subframeParams[param] = val
-
-			# Build the Frame object
-			frame = speechPlayer.Frame()
-			frame.preFormantGain = 1.0
-			frame.outputGain = 1.0
-			applyPhonemeToFrame(frame, subframeParams)
+			for param, target, onset_val, offset_val in blendedParams:
+				setattr(frame, param, _blend_value(target, onset_val, offset_val, t))
+
 			applyFormantScaling(frame, formantScale)
 
 			# Apply voice quality overrides
@@ -267,6 +267,15 @@ ALL_MAPPINGS.update(IPA_PUNCTUATION)
 ALL_MAPPINGS.update(IPA_TONES)
 ALL_MAPPINGS.update(IPA_SPECIAL)
 
+# Flattened (key, press_count) -> (symbol, description) table for the
+# per-keystroke lookup, plus each key's cycle length for wrap-around
+_LOOKUP = {
+    (key, i + 1): entry
+    for key, symbols in ALL_MAPPINGS.items()
+    for i, entry in enumerate(symbols)
+}
+_CYCLE_LENGTHS = {key: len(symbols) for key, symbols in ALL_MAPPINGS.items()}
+
 
 def get_symbol_for_key(key, press_count=1):
     """
@@ -280,12 +289,28 @@ def get_symbol_for_key(key, press_count=1):
         Tuple of (symbol, description) or None if no mapping exists
     """
     key = key.lower()
-    if key not in ALL_MAPPINGS:
+    cycle_length = _CYCLE_LENGTHS.get(key)
+    if not cycle_length:
         return None
 
-    symbols = ALL_MAPPINGS[key]
-    index = (press_count - 1) % len(symbols)
-    return symbols[index]
+    return _LOOKUP[(key, (press_count - 1) % cycle_length + 1)]
+
+
+def get_modifier_keys():
+    """
+    Get the wx key codes of bare modifier presses.
+
+    A modifier pressed on its own never maps to a shortcut or IPA symbol,
+    so the GUIs' key handlers skip these straight away. wx is imported
+    here rather than at module level so the symbol tables stay usable
+    without it.
+
+    Returns:
+        frozenset of wx key codes
+    """
+    import wx
+    return frozenset((wx.WXK_ALT, wx.WXK_SHIFT, wx.WXK_CONTROL, wx.WXK_RAW_CONTROL,
+                      wx.WXK_WINDOWS_LEFT, wx.WXK_WINDOWS_RIGHT))
 
 
 def get_all_symbols_for_key(key):
@@ -100,12 +100,23 @@ def _setupDllFunctions(dll):
 	dll.speechPlayer_terminate.argtypes = [c_void_p]
 	dll.speechPlayer_terminate.restype = None
 
+_dll=None
+
+def _getDll():
+	# Load the DLL and set up its prototypes once per process;
+	# players are cheap to create after that.
+	global _dll
+	if _dll is None:
+		dll=cdll.LoadLibrary(dllPath)
+		_setupDllFunctions(dll)
+		_dll=dll
+	return _dll
+
 class SpeechPlayer(object):
 
 	def __init__(self,sampleRate):
 		self.sampleRate=sampleRate
-		self._dll=cdll.LoadLibrary(dllPath)
-		_setupDllFunctions(self._dll)
+		self._dll=_getDll()
 		self._speechHandle=self._dll.speechPlayer_initialize(sampleRate)
 
 	def queueFrame(self,frame,minFrameDuration,fadeDuration,userIndex=-1,purgeQueue=False):
@@ -114,6 +125,19 @@ class SpeechPlayer(object):
 			userIndex=-1
 		self._dll.speechPlayer_queueFrame(self._speechHandle,frame,int(minFrameDuration*(self.sampleRate/1000.0)),int(fadeDuration*(self.sampleRate/1000.0)),userIndex,purgeQueue)
 
+	def queueFrames(self,frames):
+		# Queue an iterable of (frame, minFrameDuration, fadeDuration) tuples,
+		# resolving the DLL function and ms-to-samples factor once for the whole batch.
+		# Returns the number of frames queued.
+		queueFrame=self._dll.speechPlayer_queueFrame
+		handle=self._speechHandle
+		samplesPerMs=self.sampleRate/1000.0
+		count=0
+		for frame,minFrameDuration,fadeDuration in frames:
+			queueFrame(handle,byref(frame) if frame else None,int(minFrameDuration*samplesPerMs),int(fadeDuration*samplesPerMs),-1,False)
+			count+=1
+		return count
+
 	def synthesize(self,numSamples):
 		buf=(c_short*numSamples)()
 		res=self._dll.speechPlayer_synthesize(self._speechHandle,numSamples,buf)
@@ -39,6 +39,7 @@ class FrameManagerImpl: public FrameManager {
 	bool curFrameIsNULL;
 	unsigned int sampleCounter;
 	int lastUserIndex;
+	bool instantParam[speechPlayer_frame_numParams];  // Params that skip interpolation
 
 	void updateCurrentFrame() {
 		sampleCounter++;
@@ -49,20 +50,18 @@ class FrameManagerImpl: public FrameManager {
 				oldFrameRequest=newFrameRequest;
 				newFrameRequest=NULL;
 			} else {
-				double curFadeRatio=(double)sampleCounter/(newFrameRequest->numFadeSamples);
+				// Runs once per sample for the whole fade, so evaluate the
+				// smoothstep curve once and walk the frames as flat arrays
+				double smoothRatio=smoothstep((double)sampleCounter/(newFrameRequest->numFadeSamples));
+				const speechPlayer_frameParam_t* oldParams=(const speechPlayer_frameParam_t*)&(oldFrameRequest->frame);
+				const speechPlayer_frameParam_t* newParams=(const speechPlayer_frameParam_t*)&(newFrameRequest->frame);
+				speechPlayer_frameParam_t* curParams=(speechPlayer_frameParam_t*)&curFrame;
 				for(int i=0;i<speechPlayer_frame_numParams;++i) {
-					// These parameters step instantly (no smoothstep interpolation)
-					// to avoid audible filter sweeps and ensure correct onset timing
-					if (i == FRAME_INDEX(burstAmplitude) || i == FRAME_INDEX(burstDuration)
-					    || i == FRAME_INDEX(fricationAmplitude) || i == FRAME_INDEX(noiseFilterFreq)
-					    || i == FRAME_INDEX(noiseFilterBw) || i == FRAME_INDEX(parallelAntiFreq)
-					    || i == FRAME_INDEX(trillRate) || i == FRAME_INDEX(trillDepth)
-					    || i == FRAME_INDEX(burstFilterFreq) || i == FRAME_INDEX(burstFilterBw)
-					    || i == FRAME_INDEX(burstNoiseColor)) {
+					if (instantParam[i]) {
 						// Use target value immediately
-						((speechPlayer_frameParam_t*)&curFrame)[i] = ((speechPlayer_frameParam_t*)&(newFrameRequest->frame))[i];
+						curParams[i]=newParams[i];
 					} else {
-						((speechPlayer_frameParam_t*)&curFrame)[i]=calculateValueAtFadePosition(((speechPlayer_frameParam_t*)&(oldFrameRequest->frame))[i],((speechPlayer_frameParam_t*)&(newFrameRequest->frame))[i],curFadeRatio);
+						curParams[i]=calculateValueAtSmoothFadePosition(oldParams[i],newParams[i],smoothRatio);
 					}
 				}
 			}
@@ -104,6 +103,20 @@ class FrameManagerImpl: public FrameManager {
 	FrameManagerImpl(): curFrame(), curFrameIsNULL(true), sampleCounter(0), newFrameRequest(NULL), lastUserIndex(-1)  {
 		oldFrameRequest=new frameRequest_t();
 		oldFrameRequest->NULLFrame=true;
+		// These parameters step instantly (no smoothstep interpolation)
+		// to avoid audible filter sweeps and ensure correct onset timing
+		for(int i=0;i<speechPlayer_frame_numParams;++i) instantParam[i]=false;
+		instantParam[FRAME_INDEX(burstAmplitude)]=true;
+		instantParam[FRAME_INDEX(burstDuration)]=true;
+		instantParam[FRAME_INDEX(fricationAmplitude)]=true;
+		instantParam[FRAME_INDEX(noiseFilterFreq)]=true;
+		instantParam[FRAME_INDEX(noiseFilterBw)]=true;
+		instantParam[FRAME_INDEX(parallelAntiFreq)]=true;
+		instantParam[FRAME_INDEX(trillRate)]=true;
+		instantParam[FRAME_INDEX(trillDepth)]=true;
+		instantParam[FRAME_INDEX(burstFilterFreq)]=true;
+		instantParam[FRAME_INDEX(burstFilterBw)]=true;
+		instantParam[FRAME_INDEX(burstNoiseColor)]=true;
 	}
 
 	void queueFrame(speechPlayer_frame_t* frame, unsigned int minNumSamples, unsigned int numFadeSamples, int userIndex, bool purgeQueue) {
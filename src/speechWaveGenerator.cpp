@@ -307,19 +307,27 @@ class SpectralTiltFilter {
 	int sampleRate;
 	double lastOutput1, lastOutput2;  // Two cascaded stages
 
+	// Cached coefficient (updated only when tiltDB changes)
+	double lastTiltDB;
+	double alpha;
+
 	public:
-	SpectralTiltFilter(int sr): sampleRate(sr), lastOutput1(0.0), lastOutput2(0.0) {}
+	SpectralTiltFilter(int sr): sampleRate(sr), lastOutput1(0.0), lastOutput2(0.0), lastTiltDB(-1.0), alpha(0.0) {}
 
 	double filter(double input, double tiltDB) {
 		if (tiltDB < 1.5) return input;
 
-		double attenLinear = pow(10.0, -tiltDB / 20.0);
-		if (attenLinear <= 0.001) attenLinear = 0.001;
+		if (tiltDB != lastTiltDB) {
+			lastTiltDB = tiltDB;
+
+			double attenLinear = pow(10.0, -tiltDB / 20.0);
+			if (attenLinear <= 0.001) attenLinear = 0.001;
 
-		// For two cascaded stages: |H(f)|^2 = 1/(1+(f/fc)^2)^2
-		// At 5kHz we want |H|=attenLinear, so solve: fc = 5000/sqrt(1/atten - 1)
-		double fc = 5000.0 / sqrt(1.0 / attenLinear - 1.0);
-		double alpha = exp(-2.0 * M_PI * fc / sampleRate);
+			// For two cascaded stages: |H(f)|^2 = 1/(1+(f/fc)^2)^2
+			// At 5kHz we want |H|=attenLinear, so solve: fc = 5000/sqrt(1/atten - 1)
+			double fc = 5000.0 / sqrt(1.0 / attenLinear - 1.0);
+			alpha = exp(-2.0 * M_PI * fc / sampleRate);
+		}
 
 		double stage1 = (1.0 - alpha) * input + alpha * lastOutput1;
 		lastOutput1 = stage1;
@@ -487,11 +495,15 @@ class VoiceGenerator {
 	bool periodAlternate;  // KLSYN88: alternating period flag
 	double currentTe;       // Excitation point for PolyBLEP (0 when unvoiced)
 	double currentAmpNorm;  // LF amplitude normalization (0 when unvoiced)
+
+	// Cached LF timing parameters (updated only when lfRd changes)
+	double lastLfRd;
+	double lfTp, lfTe, lfEpsilon, lfAmpNorm;
 	HalfbandDecimator hbStage1, hbStage2;  // 4x→2x→1x decimation
 
 	public:
 	bool glottisOpen;
-	VoiceGenerator(int sr): pitchGen(sr), vibratoGen(sr), sinusoidalGen(sr), aspirationGen(sr), jitterShimmer(), lastCyclePos(0), periodAlternate(false), glottisOpen(false), currentTe(0), currentAmpNorm(0) {};
+	VoiceGenerator(int sr): pitchGen(sr), vibratoGen(sr), sinusoidalGen(sr), aspirationGen(sr), jitterShimmer(), lastCyclePos(0), periodAlternate(false), glottisOpen(false), currentTe(0), currentAmpNorm(0), lastLfRd(-1.0), lfTp(0), lfTe(0), lfEpsilon(0), lfAmpNorm(0) {};
 
 	double getNext(const speechPlayer_frame_t* frame) {
 		double vibrato=(sin(vibratoGen.getNext(frame->vibratoSpeed)*PITWO)*0.06*frame->vibratoPitchOffset)+1;
@@ -530,36 +542,49 @@ class VoiceGenerator {
 			// Improved Liljencrants-Fant (LF) glottal model
 			// Based on Fant 1995 and Degottex et al. 2011 refinements
 			// Rd parameter controls voice quality: 0.3=tense, 1.0=modal, 2.7=breathy
-			double Rd = max(0.3, min(2.7, frame->lfRd));
-
-			// Improved Rd-to-parameter mapping (Fant 1995 / Degottex 2011)
-			double Rap = (-1.0 + 4.8 * Rd) / 100.0;           // Return phase quotient
-			double Rkp = (22.4 + 11.8 * Rd) / 100.0;          // Open quotient shape
-			double Rgp = 1.0 / (4.0 * ((0.11 * Rd / (0.5 + 1.2 * Rkp)) - Rap)); // Rise time
-
-			// Clamp parameters to valid ranges
-			if (Rap < 0.01) Rap = 0.01;
-			if (Rap > 0.20) Rap = 0.20;
-			if (Rkp < 0.20) Rkp = 0.20;
-			if (Rkp > 0.80) Rkp = 0.80;
-			if (Rgp < 0.50) Rgp = 0.50;
-			if (Rgp > 3.00) Rgp = 3.00;
-
-			// Derived timing parameters (normalized to T0 = 1)
-			double tp = 1.0 / (2.0 * Rgp);           // Time of peak flow
-			double te = tp * (1.0 + Rkp);            // Time of excitation (max negative derivative)
-			double ta = Rap;                          // Return phase time constant
-
-			// Ensure valid timing
-			if (tp > 0.45) tp = 0.45;
-			if (te > 0.98) te = 0.98;
-			if (te < tp + 0.05) te = tp + 0.05;
-
-			// Calculate epsilon for return phase (ensures smooth decay to zero)
-			double epsilon = 1.0 / (ta * (1.0 - te) + 0.001);
-
-			// Amplitude normalization factor for consistent output level
-			double ampNorm = 1.0 / (0.5 + 0.3 * Rd);
+			// The derived timing only depends on Rd, so it is recomputed when Rd changes.
+			if (frame->lfRd != lastLfRd) {
+				lastLfRd = frame->lfRd;
+				double Rd = max(0.3, min(2.7, frame->lfRd));
+
+				// Improved Rd-to-parameter mapping (Fant 1995 / Degottex 2011)
+				double Rap = (-1.0 + 4.8 * Rd) / 100.0;           // Return phase quotient
+				double Rkp = (22.4 + 11.8 * Rd) / 100.0;          // Open quotient shape
+				double Rgp = 1.0 / (4.0 * ((0.11 * Rd / (0.5 + 1.2 * Rkp)) - Rap)); // Rise time
+
+				// Clamp parameters to valid ranges
+				if (Rap < 0.01) Rap = 0.01;
+				if (Rap > 0.20) Rap = 0.20;
+				if (Rkp < 0.20) Rkp = 0.20;
+				if (Rkp > 0.80) Rkp = 0.80;
+				if (Rgp < 0.50) Rgp = 0.50;
+				if (Rgp > 3.00) Rgp = 3.00;
+
+				// Derived timing parameters (normalized to T0 = 1)
+				double tp = 1.0 / (2.0 * Rgp);           // Time of peak flow
+				double te = tp * (1.0 + Rkp);            // Time of excitation (max negative derivative)
+				double ta = Rap;                          // Return phase time constant
+
+				// Ensure valid timing
+				if (tp > 0.45) tp = 0.45;
+				if (te > 0.98) te = 0.98;
+				if (te < tp + 0.05) te = tp + 0.05;
+
+				// Calculate epsilon for return phase (ensures smooth decay to zero)
+				double epsilon = 1.0 / (ta * (1.0 - te) + 0.001);
+
+				// Amplitude normalization factor for consistent output level
+				double ampNorm = 1.0 / (0.5 + 0.3 * Rd);
+
+				lfTp = tp;
+				lfTe = te;
+				lfEpsilon = epsilon;
+				lfAmpNorm = ampNorm;
+			}
+			double tp = lfTp;
+			double te = lfTe;
+			double epsilon = lfEpsilon;
+			double ampNorm = lfAmpNorm;
 
 			// Store for PolyBLEP at te
 			currentTe = te;
@@ -24,11 +24,16 @@ inline double smoothstep(double t) {
 	return t * t * t * (t * (t * 6.0 - 15.0) + 10.0);
 }
 
-inline double calculateValueAtFadePosition(double oldVal, double newVal, double curFadeRatio) {
+// Interpolate with a ratio that has already been through smoothstep(),
+// so callers fading many values at once only evaluate the curve once
+inline double calculateValueAtSmoothFadePosition(double oldVal, double newVal, double smoothRatio) {
 	if(std::isnan(newVal)) return oldVal;
-	// Apply smoothstep for gentler start/end of transitions
-	double smoothRatio = smoothstep(curFadeRatio);
 	return oldVal + ((newVal - oldVal) * smoothRatio);
 }
 
+inline double calculateValueAtFadePosition(double oldVal, double newVal, double curFadeRatio) {
+	// Apply smoothstep for gentler start/end of transitions
+	return calculateValueAtSmoothFadePosition(oldVal, newVal, smoothstep(curFadeRatio));
+}
+
 #endif
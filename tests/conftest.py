@@ -7,10 +7,10 @@ phoneme frame building using the actual phoneme data as source of truth.
 Used by test_vowels.py, test_consonants.py, test_engine.py, etc.
 """
 
+import array
 import os
 import sys
 import wave
-import struct
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -41,8 +41,8 @@ def save_wav(filename, samples, sample_rate=SAMPLE_RATE):
         wav.setnchannels(1)
         wav.setsampwidth(2)
         wav.setframerate(sample_rate)
-        data = struct.pack(f'<{len(samples)}h', *samples)
-        wav.writeframes(data)
+        wav.setnframes(len(samples))  # Header is final, no patch on close
+        wav.writeframes(array.array('h', samples))
     return filepath
 
 
@@ -53,15 +53,14 @@ def collect_samples(sp):
         sp: speechPlayer.SpeechPlayer instance
 
     Returns:
-        List of int16 sample values.
+        array.array('h') of int16 sample values.
     """
-    samples = []
+    samples = array.array('h')
     while True:
         chunk = sp.synthesize(4096)
         if not chunk:
             break
-        n = chunk.length
-        samples.extend(struct.unpack(f'<{n}h', bytes(chunk)[:n * 2]))
+        samples.frombytes(memoryview(chunk).cast('B')[:chunk.length * 2])
     return samples
 
 
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Prebuilt phoneme data cache tests.
+
+Validates that data/_prebuilt.marshal is written on a cold import, reused
+while the source modules are unchanged, and rebuilt when it is stale,
+corrupt or from an incompatible version. Cached and rebuilt results must be
+identical, including the per-category views. No DLL is needed.
+
+Usage:
+    python tests/phonemes/test_data_cache.py
+"""
+
+import sys
+import os
+import marshal
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import data as data_pkg
+
+
+def _load_with_cache(cache_path):
+    """Run the package's cache loader against cache_path instead of data/."""
+    saved_path = data_pkg._PREBUILT_PATH
+    data_pkg._PREBUILT_PATH = cache_path
+    try:
+        return data_pkg._load()
+    finally:
+        data_pkg._PREBUILT_PATH = saved_path
+
+
+def _categories(merged, category_keys):
+    """Build PHONEME_CATEGORIES the way the package does from a load result."""
+    return {
+        category: {key: merged[key] for key in category_keys[category]}
+        for category in data_pkg.CATEGORY_ORDER
+    }
+
+
+def _assert_matches_rebuild(result, label):
+    merged, category_keys = result
+    rebuilt, rebuilt_keys = data_pkg._build()
+    assert merged == rebuilt, f"{label}: merged data differs from a fresh build"
+    assert list(merged) == list(rebuilt), f"{label}: phoneme order differs from a fresh build"
+    assert category_keys == rebuilt_keys, f"{label}: category keys differ from a fresh build"
+    assert _categories(merged, category_keys) == _categories(rebuilt, rebuilt_keys), \
+        f"{label}: PHONEME_CATEGORIES differs from a fresh build"
+
+
+def _write_cache(cache_path, **overrides):
+    """Write a cache file from a fresh build, with some fields replaced."""
+    merged, category_keys = data_pkg._build()
+    prebuilt = {
+        'version': data_pkg._PREBUILT_VERSION,
+        'sources': data_pkg._source_stamps(),
+        'data': merged,
+        'categories': category_keys,
+    }
+    prebuilt.update(overrides)
+    with open(cache_path, 'wb') as f:
+        f.write(marshal.dumps(prebuilt))
+
+
+def test_cold_then_warm():
+    """A cold load writes the cache; a warm load returns the same data from it."""
+    print("\n=== Test: Cold and Warm Load ===")
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        cache_path = os.path.join(tmp_dir, '_prebuilt.marshal')
+        cold = _load_with_cache(cache_path)
+        assert os.path.exists(cache_path), "Cold load did not write the cache"
+        _assert_matches_rebuild(cold, "cold")
+
+        # Replace the cached data with a marker: a warm load must use the file
+        _write_cache(cache_path, data={'marker': {}}, categories={})
+        merged, _ = _load_with_cache(cache_path)
+        assert merged == {'marker': {}}, "Warm load did not read the cache"
+
+        _write_cache(cache_path)
+        warm = _load_with_cache(cache_path)
+        _assert_matches_rebuild(warm, "warm")
+
+        assert data_pkg.PHONEME_CATEGORIES.keys() == _categories(*warm).keys()
+        for category, phonemes in data_pkg.PHONEME_CATEGORIES.items():
+            assert list(phonemes) == warm[1][category], f"{category}: keys differ from the cache"
+    finally:
+        shutil.rmtree(tmp_dir)
+    print("  PASSED")
+    return True
+
+
+def test_stale_cache_rebuilds():
+    """A cache whose source stamps don't match is rebuilt and rewritten."""
+    print("\n=== Test: Stale Cache ===")
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        cache_path = os.path.join(tmp_dir, '_prebuilt.marshal')
+        stamps = [(name, mtime - 1, size) for name, mtime, size in data_pkg._source_stamps()]
+        _write_cache(cache_path, sources=stamps, data={'stale': {}}, categories={})
+        _assert_matches_rebuild(_load_with_cache(cache_path), "stale")
+
+        with open(cache_path, 'rb') as f:
+            rewritten = marshal.loads(f.read())
+        assert rewritten['sources'] == data_pkg._source_stamps(), "Stale cache was not rewritten"
+    finally:
+        shutil.rmtree(tmp_dir)
+    print("  PASSED")
+    return True
+
+
+def test_bad_cache_rebuilds():
+    """Corrupt, truncated or other-version caches fall back to a rebuild."""
+    print("\n=== Test: Corrupt and Incompatible Cache ===")
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        cache_path = os.path.join(tmp_dir, '_prebuilt.marshal')
+
+        with open(cache_path, 'wb') as f:
+            f.write(b'not a marshal file')
+        _assert_matches_rebuild(_load_with_cache(cache_path), "corrupt")
+
+        _write_cache(cache_path)
+        with open(cache_path, 'rb') as f:
+            contents = f.read()
+        with open(cache_path, 'wb') as f:
+            f.write(contents[:len(contents) // 2])
+        _assert_matches_rebuild(_load_with_cache(cache_path), "truncated")
+
+        _write_cache(cache_path, version=data_pkg._PREBUILT_VERSION + 1, data={'old': {}}, categories={})
+        _assert_matches_rebuild(_load_with_cache(cache_path), "other version")
+
+        with open(cache_path, 'wb') as f:
+            f.write(marshal.dumps(['wrong', 'shape']))
+        _assert_matches_rebuild(_load_with_cache(cache_path), "wrong shape")
+    finally:
+        shutil.rmtree(tmp_dir)
+    print("  PASSED")
+    return True
+
+
+def test_unwritable_cache_dir():
+    """If the cache can't be written, loading still succeeds and leaves no temp file."""
+    print("\n=== Test: Unwritable Cache Directory ===")
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        # A missing directory fails the same way a read-only one does, and
+        # unlike chmod it also holds when the tests run as root
+        cache_path = os.path.join(tmp_dir, 'missing', '_prebuilt.marshal')
+        _assert_matches_rebuild(_load_with_cache(cache_path), "unwritable")
+        assert os.listdir(tmp_dir) == [], "Unwritable cache left files behind"
+    finally:
+        shutil.rmtree(tmp_dir)
+    print("  PASSED")
+    return True
+
+
+def run_all_tests():
+    """Run all phoneme data cache tests."""
+    print("=" * 60)
+    print("Phoneme Data Cache Tests")
+    print("=" * 60)
+
+    tests = [
+        test_cold_then_warm,
+        test_stale_cache_rebuilds,
+        test_bad_cache_rebuilds,
+        test_unwritable_cache_dir,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"  FAILED: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -494,7 +494,7 @@ def play_transition(vowel1, vowel2, fade_ms=60, duration_ms=300):
         import speechPlayer
         import ipa
         import wave
-        import struct
+        import array
         import tempfile
     except ImportError as e:
         print(f"Error importing modules: {e}")
@@ -531,12 +531,12 @@ def play_transition(vowel1, vowel2, fade_ms=60, duration_ms=300):
     sp.queueFrame(None, 100, 50)
 
     # Synthesize
-    all_samples = []
+    all_samples = array.array('h')
     BATCH_SIZE = 8192
     while True:
         samples = sp.synthesize(BATCH_SIZE)
         if samples:
-            all_samples.extend(samples[:])
+            all_samples.frombytes(memoryview(samples).cast('B'))
             if len(samples) < BATCH_SIZE:
                 break
         else:
@@ -553,7 +553,7 @@ def play_transition(vowel1, vowel2, fade_ms=60, duration_ms=300):
             wav.setnchannels(1)
             wav.setsampwidth(2)
             wav.setframerate(SAMPLE_RATE)
-            wav.writeframes(struct.pack('<%dh' % len(all_samples), *all_samples))
+            wav.writeframes(all_samples)
 
         if HAS_WINSOUND:
             print(f"Playing: {vowel1} -> {vowel2} (fade: {fade_ms}ms)")
@@ -672,7 +672,7 @@ def generate_vowel_wav(vowel, output_path, duration_ms=500, start_pitch=120, end
         from data import data as phoneme_data_dict
         import speechPlayer
         import wave
-        import struct
+        import array
 
         SAMPLE_RATE = 16000
 
@@ -723,18 +723,13 @@ def generate_vowel_wav(vowel, output_path, duration_ms=500, start_pitch=120, end
             return False
 
         # Synthesize in batches
-        all_samples = []
+        all_samples = array.array('h')
         BATCH_SIZE = 8192
         while True:
             samples = sp.synthesize(BATCH_SIZE)
-            if samples and hasattr(samples, 'length') and samples.length > 0:
-                all_samples.extend(samples[:samples.length])
-            elif samples:
-                all_samples.extend(samples[:])
-                if len(samples) < BATCH_SIZE:
-                    break
-            else:
+            if not samples:
                 break
+            all_samples.frombytes(memoryview(samples).cast('B')[:samples.length * 2])
 
         if not all_samples:
             print(f"Error: No samples generated for vowel '{vowel}'")
@@ -745,7 +740,7 @@ def generate_vowel_wav(vowel, output_path, duration_ms=500, start_pitch=120, end
             wav.setnchannels(1)
             wav.setsampwidth(2)
             wav.setframerate(SAMPLE_RATE)
-            wav.writeframes(struct.pack('<%dh' % len(all_samples), *all_samples))
+            wav.writeframes(all_samples)
 
         return True
     except Exception as e:
@@ -21,7 +21,6 @@ import sys
 import io
 import argparse
 import wave
-import struct
 
 # Fix encoding for IPA output on Windows
 if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
@@ -85,13 +84,13 @@ def _build_frame(ipa_char, pitch=120):
 
 def _collect_samples(sp):
     """Drain all samples from a SpeechPlayer."""
-    samples = []
+    chunks = []
     while True:
         chunk = sp.synthesize(1024)
         if not chunk:
             break
-        samples.extend(chunk[i] for i in range(len(chunk)))
-    return samples
+        chunks.append(np.frombuffer(chunk, dtype=np.int16, count=chunk.length).copy())
+    return np.concatenate(chunks) if chunks else np.empty(0, np.int16)
 
 
 def _save_wav(filename, samples):
@@ -102,8 +101,7 @@ def _save_wav(filename, samples):
         wav.setnchannels(1)
         wav.setsampwidth(2)
         wav.setframerate(SAMPLE_RATE)
-        data = struct.pack(f'<{len(samples)}h', *samples)
-        wav.writeframes(data)
+        wav.writeframes(np.asarray(samples, dtype=np.int16).tobytes())
     return filepath
 
 
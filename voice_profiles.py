@@ -11,6 +11,8 @@ Formant scaling factors are derived from vocal tract length differences:
 - Child (5-10yr): ~12 cm (~30-40% shorter, formants ~35% higher)
 """
 
+import functools
+
 VOICE_PROFILES = {
     'male': {
         'name': 'Adult Male',
@@ -51,6 +53,13 @@ VOICE_PROFILES = {
 }
 
 
+# UI names in display order, with Custom always last
+_PROFILE_NAMES = tuple(
+    [p['name'] for p in VOICE_PROFILES.values() if p['name'] != 'Custom'] + ['Custom']
+)
+
+
+@functools.lru_cache(maxsize=None)
 def get_profile(name):
     """Get a voice profile by name (case-insensitive)."""
     key = name.lower().replace(' ', '_').replace('adult_', '')
@@ -59,4 +68,4 @@ def get_profile(name):
 
 def get_profile_names():
     """Get list of available profile names for UI."""
-    return [p['name'] for p in VOICE_PROFILES.values() if p['name'] != 'Custom'] + ['Custom']
+    return list(_PROFILE_NAMES)